@@ -2,6 +2,87 @@
 
 import hashlib
 import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class Credentials:
+    """
+    Podcast Index API credentials.
+
+    The secret is excluded from repr so credentials never leak into logs or tracebacks.
+
+    Attributes:
+        api_key: Podcast Index API key
+        api_secret: Podcast Index API secret
+    """
+
+    api_key: str
+    api_secret: str = field(repr=False)
+
+
+def load_credentials(environ: Mapping[str, str]) -> Credentials:
+    """
+    Load and validate Podcast Index API credentials from environment variables.
+
+    Args:
+        environ: Environment mapping, typically os.environ
+
+    Returns:
+        Validated credentials
+
+    Raises:
+        ValueError: If PODCAST_INDEX_API_KEY or PODCAST_INDEX_API_SECRET is missing or empty
+    """
+    api_key = environ.get("PODCAST_INDEX_API_KEY")
+    api_secret = environ.get("PODCAST_INDEX_API_SECRET")
+
+    if not api_key or not api_secret:
+        raise ValueError(
+            "PODCAST_INDEX_API_KEY and PODCAST_INDEX_API_SECRET environment variables must be set"
+        )
+
+    return Credentials(api_key=api_key, api_secret=api_secret)
+
+
+DEFAULT_USER_AGENT = "podcast-index-mcp/0.1.0"
+
+# Headers from the most recent call keyed by (api_key, api_secret, user_agent, timestamp).
+# The signature only changes when the second ticks over, so bursts of requests within
+# one second share a single SHA-1 computation.
+_headers_cache: tuple[tuple[str, str, str, str], dict[str, str]] | None = None
+
+
+class _HashState(Protocol):
+    """Incremental hash state, as returned by hashlib constructors."""
+
+    def copy(self) -> "_HashState": ...
+
+    def update(self, data: bytes, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+@lru_cache(maxsize=4)
+def _auth_hash_prefix(api_key: str, api_secret: str) -> _HashState:
+    """
+    Get a SHA-1 state that has already consumed apiKey + apiSecret.
+
+    Callers copy the state and feed it only the timestamp, so the static part of the
+    signature is hashed once per set of credentials. The returned object must not be
+    updated directly.
+
+    Args:
+        api_key: Podcast Index API key
+        api_secret: Podcast Index API secret
+
+    Returns:
+        SHA-1 hash object seeded with the credentials
+    """
+    return hashlib.sha1(f"{api_key}{api_secret}".encode())
 
 
 def generate_auth_headers(
@@ -22,18 +103,25 @@ def generate_auth_headers(
         user_agent: Optional custom user agent string
 
     Returns:
-        Dictionary of HTTP headers for authentication
+        New dictionary of HTTP headers for authentication, safe for the caller to modify
     """
+    global _headers_cache
     timestamp = str(int(time.time()))
+    resolved_user_agent = user_agent if user_agent is not None else DEFAULT_USER_AGENT
 
-    auth_string = f"{api_key}{api_secret}{timestamp}"
-    auth_hash = hashlib.sha1(auth_string.encode()).hexdigest()
+    cache_key = (api_key, api_secret, resolved_user_agent, timestamp)
+    if _headers_cache is not None and _headers_cache[0] == cache_key:
+        return dict(_headers_cache[1])
 
-    default_user_agent = "podcast-index-mcp/0.1.0"
+    signature = _auth_hash_prefix(api_key, api_secret).copy()
+    signature.update(timestamp.encode())
+    auth_hash = signature.hexdigest()
 
-    return {
+    headers = {
         "X-Auth-Key": api_key,
         "X-Auth-Date": timestamp,
         "Authorization": auth_hash,
-        "User-Agent": user_agent if user_agent is not None else default_user_agent,
+        "User-Agent": resolved_user_agent,
     }
+    _headers_cache = (cache_key, headers)
+    return dict(headers)
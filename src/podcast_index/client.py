@@ -1,30 +1,416 @@
 """Podcast Index API client."""
 
+import asyncio
+import logging
+import math
+import os
+import random
+import time
+import weakref
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 import httpx
 
-from podcast_index.auth import generate_auth_headers
+from podcast_index.auth import Credentials, generate_auth_headers
 
+logger = logging.getLogger(__name__)
 
-# Shared HTTP client for connection pooling across requests
+# Shared HTTP client for connection pooling across requests, and the process that
+# created it
 _http_client: httpx.AsyncClient | None = None
+_http_client_pid: int | None = None
+
+# Tool calls arrive seconds apart while the model reasons between them, so idle
+# connections are kept alive well past httpx's 5 second default to avoid paying a
+# fresh TCP+TLS handshake on nearly every call.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Bounded per-stage timeouts so a stalled handshake or slow read fails fast instead of
+# holding a pooled connection indefinitely. Acquiring a pooled connection should be
+# near-instant, so waiting long for one signals saturation.
+HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=2.0)
+
+
+API_BASE_URL = "https://api.podcastindex.org/api/1.0"
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    """
+    Query parameter layout for a Podcast Index API endpoint.
+
+    Attributes:
+        path: Endpoint path relative to API_BASE_URL
+        required: Parameters always sent
+        optional: Parameters sent with their value when present
+        flags: Boolean parameters sent as "true" when truthy and omitted otherwise
+        url: Absolute endpoint URL, derived from path once at definition time
+    """
+
+    path: str
+    required: tuple[str, ...]
+    optional: tuple[str, ...] = ()
+    flags: tuple[str, ...] = ()
+    url: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "url", f"{API_BASE_URL}{self.path}")
+
+
+SEARCH_BY_TERM = Endpoint(
+    path="/search/byterm",
+    required=("q",),
+    optional=("max", "val"),
+    flags=("aponly", "clean", "similar", "fulltext"),
+)
+SEARCH_BY_TITLE = Endpoint(
+    path="/search/bytitle",
+    required=("q",),
+    optional=("max", "val"),
+    flags=("clean", "similar", "fulltext"),
+)
+SEARCH_BY_PERSON = Endpoint(
+    path="/search/byperson",
+    required=("q",),
+    optional=("max",),
+    flags=("fulltext",),
+)
+EPISODES_BY_FEED_ID = Endpoint(
+    path="/episodes/byfeedid",
+    required=("id",),
+    optional=("since", "max"),
+    flags=("fulltext",),
+)
+PODCAST_BY_FEED_ID = Endpoint(path="/podcasts/byfeedid", required=("id",))
+EPISODE_BY_ID = Endpoint(path="/episodes/byid", required=("id",), flags=("fulltext",))
+
+
+def _encode_query_value(value: Any) -> str:
+    """
+    Encode a single query parameter value.
+
+    Integers (feed and episode IDs, limits, timestamps) never need quoting, so they skip
+    the quoting pass entirely; strings are always quoted to prevent parameter injection.
+    Any other value, such as a float that passed JSON schema "integer" validation, is
+    quoted in its str() form, as urlencode would.
+
+    Args:
+        value: Query parameter value
+
+    Returns:
+        URL-safe value
+    """
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        return quote_plus(value)
+    return quote_plus(str(value))
+
+
+def build_url(endpoint: Endpoint, params: Mapping[str, Any]) -> str:
+    """
+    Build an API URL with encoded query parameters for an endpoint.
+
+    Args:
+        endpoint: Endpoint describing the path and which parameters it accepts
+        params: Request parameters; keys the endpoint does not accept are ignored
+
+    Returns:
+        Complete URL with encoded query parameters
+
+    Raises:
+        KeyError: If a required parameter is missing
+    """
+    query_pairs = [
+        f"{key}={_encode_query_value(params[key])}" for key in endpoint.required
+    ]
+    query_pairs.extend(
+        f"{key}={_encode_query_value(params[key])}"
+        for key in endpoint.optional
+        if key in params
+    )
+    query_pairs.extend(f"{key}=true" for key in endpoint.flags if params.get(key))
+    return f"{endpoint.url}?{'&'.join(query_pairs)}"
 
 
 def get_client() -> httpx.AsyncClient:
     """
     Get or create the shared HTTP client for connection pooling.
 
+    HTTP/2 is enabled so concurrent tool calls are multiplexed as streams over a single
+    connection to the API host instead of each opening its own TCP/TLS connection.
+
+    A forked child process gets its own client rather than sharing the parent's pooled
+    sockets, which would interleave both processes' traffic on the same connections.
+
     Returns:
         Shared AsyncClient instance that reuses connections to the same host
     """
-    global _http_client
-    if _http_client is None:
-        _http_client = httpx.AsyncClient()
+    # No await between the check and the assignment, so concurrent coroutines on the
+    # event loop cannot both observe None and create separate clients.
+    global _http_client, _http_client_pid
+    pid = os.getpid()
+    if _http_client is None or _http_client_pid != pid:
+        _http_client = httpx.AsyncClient(
+            http2=True, limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT
+        )
+        _http_client_pid = pid
     return _http_client
 
 
+async def close_client() -> None:
+    """
+    Close the shared HTTP client and release its pooled connections.
+
+    The next call to get_client creates a fresh client.
+    """
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
+
+
+# Upper bound on requests in flight at once across all callers, so large fan-outs queue
+# locally instead of tripping the API's rate limiting.
+MAX_CONCURRENT_REQUESTS = 16
+
+_max_concurrent_requests = MAX_CONCURRENT_REQUESTS
+_request_semaphore: asyncio.Semaphore | None = None
+# Event loop and process the semaphore was created for; the loop is weakly referenced so
+# closed loops can still be garbage collected
+_request_semaphore_loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+_request_semaphore_pid: int | None = None
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """
+    Get or create the semaphore limiting concurrent API requests.
+
+    A semaphore binds to the event loop it is first contended on, so a new one is
+    created whenever it is requested from a different running loop (such as a later
+    asyncio.run call) or from a forked child process.
+
+    Returns:
+        Semaphore for the running event loop, sized by the configured concurrency limit
+    """
+    global _request_semaphore, _request_semaphore_loop, _request_semaphore_pid
+    loop = asyncio.get_running_loop()
+    pid = os.getpid()
+    if (
+        _request_semaphore is None
+        or _request_semaphore_loop is None
+        or _request_semaphore_loop() is not loop
+        or _request_semaphore_pid != pid
+    ):
+        _request_semaphore = asyncio.Semaphore(_max_concurrent_requests)
+        _request_semaphore_loop = weakref.ref(loop)
+        _request_semaphore_pid = pid
+    return _request_semaphore
+
+
+def configure_concurrency(max_concurrent: int) -> None:
+    """
+    Set the maximum number of API requests allowed in flight at once.
+
+    Takes effect for requests started after the call.
+
+    Args:
+        max_concurrent: Maximum concurrent requests (must be at least 1)
+
+    Raises:
+        ValueError: If max_concurrent is less than 1
+    """
+    global _max_concurrent_requests, _request_semaphore
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+    _max_concurrent_requests = max_concurrent
+    _request_semaphore = None
+
+
+# Retry transient failures: rate limiting, upstream/gateway errors, and connections that
+# fail before a response (including pooled keep-alive connections the server has
+# already closed). Read timeouts are not retried since a slow server rarely recovers
+# within a tool call.
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+def retry_delay(
+    attempt: int,
+    retry_after: str | None = None,
+    random_fraction: Callable[[], float] = random.random,
+) -> float:
+    """
+    Compute how long to wait before retrying a failed request.
+
+    A finite numeric Retry-After header from the server takes precedence. Otherwise the
+    delay uses exponential backoff with full jitter so concurrent callers spread out
+    instead of retrying in lockstep. Both are capped at RETRY_MAX_DELAY.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_after: Value of the response's Retry-After header, if any
+        random_fraction: Source of jitter in [0, 1)
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after is not None:
+        try:
+            server_delay = float(retry_after)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(server_delay):
+                return min(max(server_delay, 0.0), RETRY_MAX_DELAY)
+
+    backoff = min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY)
+    return backoff * random_fraction()
+
+
+async def _send(
+    client: httpx.AsyncClient, credentials: Credentials, url: str
+) -> httpx.Response:
+    """
+    Send one signed GET request while holding a concurrency slot.
+
+    Args:
+        client: HTTP client to send the request with
+        credentials: Podcast Index API credentials
+        url: Complete request URL
+
+    Returns:
+        Raw HTTP response
+    """
+    headers = generate_auth_headers(credentials.api_key, credentials.api_secret)
+    async with get_request_semaphore():
+        return await client.get(url, headers=headers)
+
+
+async def _get_json(
+    credentials: Credentials, url: str, client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
+    """
+    Make an authenticated GET request and decode the JSON response, retrying
+    transient failures.
+
+    Each attempt is signed with fresh authentication headers. Backoff waits happen
+    outside the concurrency slot so retrying requests do not block others.
+
+    Args:
+        credentials: Podcast Index API credentials
+        url: Complete request URL
+        client: HTTP client to send requests with (defaults to the shared client)
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        httpx.HTTPError: If the request fails after all retries
+        httpx.HTTPStatusError: If the API returns a non-retryable or persistent error status
+    """
+    if client is None:
+        client = get_client()
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await _send(client, credentials, url)
+        except RETRYABLE_TRANSPORT_ERRORS:
+            logger.warning(
+                f"Connection error on attempt {attempt + 1}, retrying", exc_info=True
+            )
+            delay = retry_delay(attempt)
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                response.raise_for_status()
+                return response.json()
+            logger.warning(
+                f"API returned status {response.status_code} on attempt {attempt + 1}, retrying"
+            )
+            delay = retry_delay(attempt, response.headers.get("Retry-After"))
+
+        await asyncio.sleep(delay)
+
+    response = await _send(client, credentials, url)
+    response.raise_for_status()
+    return response.json()
+
+
+# Podcast and episode records change rarely, so lookups by ID are cached for an hour.
+# Podcast searches only change as feeds are added to the index, while episode
+# listings and person searches pick up newly published episodes, so those expire
+# sooner. The oldest entry is evicted once the cache is full. Entries are keyed by API
+# key as well as URL so one caller's credentials never vouch for another's request.
+DETAILS_CACHE_TTL = 3600.0
+SEARCH_CACHE_TTL = 900.0
+LISTING_CACHE_TTL = 300.0
+RESPONSE_CACHE_MAXSIZE = 1024
+
+_response_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+
+def clear_response_cache() -> None:
+    """Discard all cached API responses."""
+    _response_cache.clear()
+
+
+async def _get_cached_json(
+    credentials: Credentials,
+    url: str,
+    ttl: float,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, Any]:
+    """
+    Return a cached response for a URL, fetching and caching it when missing or stale.
+
+    Responses are cached per API key. Requests sent through an injected client bypass
+    the cache, since that client may route to a different server than the shared one.
+    Cached responses are shared between callers and must not be mutated.
+
+    Args:
+        credentials: Podcast Index API credentials
+        url: Complete request URL
+        ttl: Seconds a fetched response stays fresh
+        client: HTTP client to send requests with (defaults to the shared client)
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        httpx.HTTPError: If the request fails after all retries
+        httpx.HTTPStatusError: If the API returns a non-retryable or persistent error status
+    """
+    if client is not None:
+        return await _get_json(credentials, url, client)
+
+    key = (credentials.api_key, url)
+    cached = _response_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = await _get_json(credentials, url)
+
+    _response_cache.pop(key, None)
+    if len(_response_cache) >= RESPONSE_CACHE_MAXSIZE:
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (time.monotonic() + ttl, result)
+    return result
+
+
 class SearchParams(TypedDict, total=False):
     """
     Parameters for podcast search requests.
@@ -135,43 +521,21 @@ def build_search_url(params: SearchParams) -> str:
     Returns:
         Complete URL with encoded query parameters
     """
-    base_url = "https://api.podcastindex.org/api/1.0/search/byterm"
-
-    query_params: dict[str, str | int] = {}
-    query_params["q"] = params["q"]
-
-    if "max" in params:
-        query_params["max"] = params["max"]
-
-    if "val" in params:
-        query_params["val"] = params["val"]
-
-    if params.get("aponly"):
-        query_params["aponly"] = "true"
-
-    if params.get("clean"):
-        query_params["clean"] = "true"
-
-    if params.get("similar"):
-        query_params["similar"] = "true"
-
-    if params.get("fulltext"):
-        query_params["fulltext"] = "true"
-
-    query_string = urlencode(query_params)
-    return f"{base_url}?{query_string}"
+    return build_url(SEARCH_BY_TERM, params)
 
 
 async def search_podcasts(
-    api_key: str, api_secret: str, params: SearchParams
+    credentials: Credentials,
+    params: SearchParams,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Search for podcasts using the Podcast Index API.
 
     Args:
-        api_key: Podcast Index API key
-        api_secret: Podcast Index API secret
+        credentials: Podcast Index API credentials
         params: Search parameters
+        client: HTTP client to send requests with (defaults to the shared client)
 
     Returns:
         API response containing search results
@@ -180,13 +544,9 @@ async def search_podcasts(
         httpx.HTTPError: If the request fails
         httpx.HTTPStatusError: If the API returns an error status
     """
-    url = build_search_url(params)
-    headers = generate_auth_headers(api_key, api_secret)
-
-    client = get_client()
-    response = await client.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
+    return await _get_cached_json(
+        credentials, build_search_url(params), SEARCH_CACHE_TTL, client
+    )
 
 
 def build_search_by_title_url(params: SearchByTitleParams) -> str:
@@ -199,40 +559,21 @@ def build_search_by_title_url(params: SearchByTitleParams) -> str:
     Returns:
         Complete URL with encoded query parameters
     """
-    base_url = "https://api.podcastindex.org/api/1.0/search/bytitle"
-
-    query_params: dict[str, str | int] = {}
-    query_params["q"] = params["q"]
-
-    if "max" in params:
-        query_params["max"] = params["max"]
-
-    if "val" in params:
-        query_params["val"] = params["val"]
-
-    if params.get("clean"):
-        query_params["clean"] = "true"
-
-    if params.get("similar"):
-        query_params["similar"] = "true"
-
-    if params.get("fulltext"):
-        query_params["fulltext"] = "true"
-
-    query_string = urlencode(query_params)
-    return f"{base_url}?{query_string}"
+    return build_url(SEARCH_BY_TITLE, params)
 
 
 async def search_podcasts_by_title(
-    api_key: str, api_secret: str, params: SearchByTitleParams
+    credentials: Credentials,
+    params: SearchByTitleParams,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Search for podcasts by title using the Podcast Index API.
 
     Args:
-        api_key: Podcast Index API key
-        api_secret: Podcast Index API secret
+        credentials: Podcast Index API credentials
         params: Search parameters
+        client: HTTP client to send requests with (defaults to the shared client)
 
     Returns:
         API response containing search results
@@ -241,13 +582,9 @@ async def search_podcasts_by_title(
         httpx.HTTPError: If the request fails
         httpx.HTTPStatusError: If the API returns an error status
     """
-    url = build_search_by_title_url(params)
-    headers = generate_auth_headers(api_key, api_secret)
-
-    client = get_client()
-    response = await client.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
+    return await _get_cached_json(
+        credentials, build_search_by_title_url(params), SEARCH_CACHE_TTL, client
+    )
 
 
 def build_search_by_person_url(params: SearchByPersonParams) -> str:
@@ -260,31 +597,21 @@ def build_search_by_person_url(params: SearchByPersonParams) -> str:
     Returns:
         Complete URL with encoded query parameters
     """
-    base_url = "https://api.podcastindex.org/api/1.0/search/byperson"
-
-    query_params: dict[str, str | int] = {}
-    query_params["q"] = params["q"]
-
-    if "max" in params:
-        query_params["max"] = params["max"]
-
-    if params.get("fulltext"):
-        query_params["fulltext"] = "true"
-
-    query_string = urlencode(query_params)
-    return f"{base_url}?{query_string}"
+    return build_url(SEARCH_BY_PERSON, params)
 
 
 async def search_episodes_by_person(
-    api_key: str, api_secret: str, params: SearchByPersonParams
+    credentials: Credentials,
+    params: SearchByPersonParams,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Search for episodes by person using the Podcast Index API.
 
     Args:
-        api_key: Podcast Index API key
-        api_secret: Podcast Index API secret
+        credentials: Podcast Index API credentials
         params: Search parameters
+        client: HTTP client to send requests with (defaults to the shared client)
 
     Returns:
         API response containing episode search results
@@ -293,13 +620,9 @@ async def search_episodes_by_person(
         httpx.HTTPError: If the request fails
         httpx.HTTPStatusError: If the API returns an error status
     """
-    url = build_search_by_person_url(params)
-    headers = generate_auth_headers(api_key, api_secret)
-
-    client = get_client()
-    response = await client.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
+    return await _get_cached_json(
+        credentials, build_search_by_person_url(params), LISTING_CACHE_TTL, client
+    )
 
 
 def build_episodes_url(params: GetEpisodesParams) -> str:
@@ -312,34 +635,21 @@ def build_episodes_url(params: GetEpisodesParams) -> str:
     Returns:
         Complete URL with encoded query parameters
     """
-    base_url = "https://api.podcastindex.org/api/1.0/episodes/byfeedid"
-
-    query_params: dict[str, str | int] = {}
-    query_params["id"] = params["id"]
-
-    if "since" in params:
-        query_params["since"] = params["since"]
-
-    if "max" in params:
-        query_params["max"] = params["max"]
-
-    if params.get("fulltext"):
-        query_params["fulltext"] = "true"
-
-    query_string = urlencode(query_params)
-    return f"{base_url}?{query_string}"
+    return build_url(EPISODES_BY_FEED_ID, params)
 
 
 async def get_episodes(
-    api_key: str, api_secret: str, params: GetEpisodesParams
+    credentials: Credentials,
+    params: GetEpisodesParams,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Get episodes from a podcast feed using the Podcast Index API.
 
     Args:
-        api_key: Podcast Index API key
-        api_secret: Podcast Index API secret
+        credentials: Podcast Index API credentials
         params: Parameters including feed ID
+        client: HTTP client to send requests with (defaults to the shared client)
 
     Returns:
         API response containing episode data
@@ -348,13 +658,9 @@ async def get_episodes(
         httpx.HTTPError: If the request fails
         httpx.HTTPStatusError: If the API returns an error status
     """
-    url = build_episodes_url(params)
-    headers = generate_auth_headers(api_key, api_secret)
-
-    client = get_client()
-    response = await client.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
+    return await _get_cached_json(
+        credentials, build_episodes_url(params), LISTING_CACHE_TTL, client
+    )
 
 
 def build_podcast_details_url(params: GetPodcastDetailsParams) -> str:
@@ -367,25 +673,21 @@ def build_podcast_details_url(params: GetPodcastDetailsParams) -> str:
     Returns:
         Complete URL with encoded query parameters
     """
-    base_url = "https://api.podcastindex.org/api/1.0/podcasts/byfeedid"
-
-    query_params: dict[str, str | int] = {}
-    query_params["id"] = params["id"]
-
-    query_string = urlencode(query_params)
-    return f"{base_url}?{query_string}"
+    return build_url(PODCAST_BY_FEED_ID, params)
 
 
 async def get_podcast_details(
-    api_key: str, api_secret: str, params: GetPodcastDetailsParams
+    credentials: Credentials,
+    params: GetPodcastDetailsParams,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Get podcast details by feed ID using the Podcast Index API.
 
     Args:
-        api_key: Podcast Index API key
-        api_secret: Podcast Index API secret
+        credentials: Podcast Index API credentials
         params: Parameters including feed ID
+        client: HTTP client to send requests with (defaults to the shared client)
 
     Returns:
         API response containing podcast details
@@ -394,13 +696,9 @@ async def get_podcast_details(
         httpx.HTTPError: If the request fails
         httpx.HTTPStatusError: If the API returns an error status
     """
-    url = build_podcast_details_url(params)
-    headers = generate_auth_headers(api_key, api_secret)
-
-    client = get_client()
-    response = await client.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
+    return await _get_cached_json(
+        credentials, build_podcast_details_url(params), DETAILS_CACHE_TTL, client
+    )
 
 
 def build_episode_details_url(params: GetEpisodeDetailsParams) -> str:
@@ -413,28 +711,21 @@ def build_episode_details_url(params: GetEpisodeDetailsParams) -> str:
     Returns:
         Complete URL with encoded query parameters
     """
-    base_url = "https://api.podcastindex.org/api/1.0/episodes/byid"
-
-    query_params: dict[str, str | int] = {}
-    query_params["id"] = params["id"]
-
-    if params.get("fulltext"):
-        query_params["fulltext"] = "true"
-
-    query_string = urlencode(query_params)
-    return f"{base_url}?{query_string}"
+    return build_url(EPISODE_BY_ID, params)
 
 
 async def get_episode_details(
-    api_key: str, api_secret: str, params: GetEpisodeDetailsParams
+    credentials: Credentials,
+    params: GetEpisodeDetailsParams,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Get episode details by ID using the Podcast Index API.
 
     Args:
-        api_key: Podcast Index API key
-        api_secret: Podcast Index API secret
+        credentials: Podcast Index API credentials
         params: Parameters including episode ID
+        client: HTTP client to send requests with (defaults to the shared client)
 
     Returns:
         API response containing episode details
@@ -443,10 +734,114 @@ async def get_episode_details(
         httpx.HTTPError: If the request fails
         httpx.HTTPStatusError: If the API returns an error status
     """
-    url = build_episode_details_url(params)
-    headers = generate_auth_headers(api_key, api_secret)
+    return await _get_cached_json(
+        credentials, build_episode_details_url(params), DETAILS_CACHE_TTL, client
+    )
 
-    client = get_client()
-    response = await client.get(url, headers=headers)
-    response.raise_for_status()
-    return response.json()
+
+async def _get_json_many(
+    credentials: Credentials,
+    urls: Iterable[str],
+    ttl: float,
+    client: httpx.AsyncClient | None = None,
+) -> list[dict[str, Any] | BaseException]:
+    """
+    Fetch several URLs concurrently over the shared client.
+
+    Each URL goes through the response cache like a single lookup. Requests are still
+    bounded by the shared concurrency limit, so large batches queue locally. A failure
+    is returned in place of its result instead of cancelling the rest of the batch.
+
+    Args:
+        credentials: Podcast Index API credentials
+        urls: Complete request URLs
+        ttl: Seconds a fetched response stays fresh in the response cache
+        client: HTTP client to send requests with (defaults to the shared client)
+
+    Returns:
+        Decoded JSON responses or raised exceptions, in the same order as urls
+    """
+    return await asyncio.gather(
+        *(_get_cached_json(credentials, url, ttl, client) for url in urls),
+        return_exceptions=True,
+    )
+
+
+async def get_podcast_details_many(
+    credentials: Credentials,
+    ids: Iterable[int],
+    client: httpx.AsyncClient | None = None,
+) -> list[dict[str, Any] | BaseException]:
+    """
+    Get podcast details for several feed IDs concurrently.
+
+    Args:
+        credentials: Podcast Index API credentials
+        ids: Podcast feed IDs
+        client: HTTP client to send requests with (defaults to the shared client)
+
+    Returns:
+        API responses, or the exception raised for that ID, in the same order as ids
+    """
+    return await _get_json_many(
+        credentials,
+        (build_podcast_details_url(GetPodcastDetailsParams(id=id_)) for id_ in ids),
+        DETAILS_CACHE_TTL,
+        client,
+    )
+
+
+async def get_episode_details_many(
+    credentials: Credentials,
+    ids: Iterable[int],
+    fulltext: bool = False,
+    client: httpx.AsyncClient | None = None,
+) -> list[dict[str, Any] | BaseException]:
+    """
+    Get episode details for several episode IDs concurrently.
+
+    Args:
+        credentials: Podcast Index API credentials
+        ids: Episode IDs
+        fulltext: Return complete text fields (otherwise truncated to 100 words)
+        client: HTTP client to send requests with (defaults to the shared client)
+
+    Returns:
+        API responses, or the exception raised for that ID, in the same order as ids
+    """
+    return await _get_json_many(
+        credentials,
+        (
+            build_episode_details_url(
+                GetEpisodeDetailsParams(id=id_, fulltext=fulltext)
+            )
+            for id_ in ids
+        ),
+        DETAILS_CACHE_TTL,
+        client,
+    )
+
+
+async def search_podcasts_many(
+    credentials: Credentials,
+    params_list: Iterable[SearchParams],
+    client: httpx.AsyncClient | None = None,
+) -> list[dict[str, Any] | BaseException]:
+    """
+    Run several podcast searches concurrently.
+
+    Args:
+        credentials: Podcast Index API credentials
+        params_list: Search parameters, one entry per search
+        client: HTTP client to send requests with (defaults to the shared client)
+
+    Returns:
+        API responses, or the exception raised for that search, in the same order as
+        params_list
+    """
+    return await _get_json_many(
+        credentials,
+        (build_search_url(params) for params in params_list),
+        SEARCH_CACHE_TTL,
+        client,
+    )
@@ -0,0 +1,261 @@
+"""Formatting of Podcast Index API responses into readable text."""
+
+from datetime import timedelta
+from typing import Any, Callable
+
+# Optional response fields rendered as "Label: value" lines, in display order.
+# The field sets are fixed by the API, so formatters walk these tables instead of
+# branching on each field individually.
+_FEED_FIELDS: tuple[tuple[str, str], ...] = (
+    ("author", "Author"),
+    ("ownerName", "Owner"),
+    ("description", "Description"),
+    ("url", "Feed URL"),
+    ("originalUrl", "Original Feed URL"),
+    ("link", "Website"),
+    ("image", "Image"),
+    ("artwork", "Artwork"),
+    ("lastUpdateTime", "Last Updated"),
+    ("lastCrawlTime", "Last Crawled"),
+    ("lastParseTime", "Last Parsed"),
+    ("lastGoodHttpStatusTime", "Last Good HTTP Status"),
+    ("lastHttpStatus", "Last HTTP Status"),
+    ("contentType", "Content Type"),
+    ("itunesId", "iTunes ID"),
+    ("generator", "Generator"),
+    ("language", "Language"),
+    ("type", "Type"),
+    ("dead", "Dead"),
+    ("crawlErrors", "Crawl Errors"),
+    ("parseErrors", "Parse Errors"),
+)
+
+_FEED_DETAIL_FIELDS: tuple[tuple[str, str], ...] = (
+    ("locked", "Locked"),
+    ("explicit", "Explicit"),
+    ("episodeCount", "Episode Count"),
+    ("imageUrlHash", "Image URL Hash"),
+    ("id", "Podcast Index ID"),
+)
+
+_FEED_ID_FIELDS: tuple[tuple[str, str], ...] = (("id", "Podcast Index ID"),)
+
+_EPISODE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("feedTitle", "Podcast"),
+    ("feedAuthor", "Author"),
+    ("description", "Description"),
+    ("datePublished", "Published"),
+    ("datePublishedPretty", "Published Date"),
+    ("duration", "Duration"),
+    ("link", "Episode URL"),
+    ("enclosureUrl", "Audio URL"),
+    ("enclosureType", "Audio Type"),
+    ("enclosureLength", "File Size"),
+    ("image", "Episode Image"),
+    ("feedImage", "Podcast Image"),
+    ("feedUrl", "Feed URL"),
+    ("chaptersUrl", "Chapters"),
+    ("transcriptUrl", "Transcript"),
+)
+
+_EPISODE_DETAIL_FIELDS: tuple[tuple[str, str], ...] = (
+    ("season", "Season"),
+    ("episode", "Episode"),
+    ("episodeType", "Episode Type"),
+    ("explicit", "Explicit"),
+    ("feedItunesId", "iTunes ID"),
+    ("feedLanguage", "Language"),
+)
+
+_EPISODE_ID_FIELDS: tuple[tuple[str, str], ...] = (
+    ("feedId", "Podcast ID"),
+    ("id", "Episode ID"),
+)
+
+
+def _format_duration(seconds: int) -> str:
+    """
+    Convert seconds to human-readable duration format.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Formatted duration string as MM:SS for durations under 1 hour,
+        or HH:MM:SS for durations 1 hour or longer
+    """
+    duration = timedelta(seconds=seconds)
+    total_secs = int(duration.total_seconds())
+    hours, remainder = divmod(total_secs, 3600)
+    minutes, secs = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes}:{secs:02d}"
+
+
+def _format_enclosure_length(length: int) -> str:
+    """
+    Format an enclosure length for display.
+
+    Args:
+        length: File size in bytes
+
+    Returns:
+        File size with a bytes unit suffix
+    """
+    return f"{length} bytes"
+
+
+_FIELD_VALUE_FORMATTERS: dict[str, Callable[[Any], str]] = {
+    "duration": _format_duration,
+    "enclosureLength": _format_enclosure_length,
+}
+
+
+def _format_fields(
+    record: dict[str, Any], fields: tuple[tuple[str, str], ...]
+) -> list[str]:
+    """
+    Render the fields present in an API record as "Label: value" lines.
+
+    Args:
+        record: API record such as a feed or episode dictionary
+        fields: (field name, display label) pairs in display order
+
+    Returns:
+        One line per field present in the record, in table order
+    """
+    return [
+        f"{label}: {_FIELD_VALUE_FORMATTERS.get(field, str)(record[field])}"
+        for field, label in fields
+        if field in record
+    ]
+
+
+def format_search_results(response: dict[str, Any]) -> str:
+    """
+    Format API response into readable text.
+
+    Args:
+        response: API response dictionary
+
+    Returns:
+        Formatted string with search results including all available fields
+    """
+    count = response.get("count", 0)
+    feeds = response.get("feeds", [])
+    query = response.get("query", "")
+
+    if count == 0:
+        return f"No matches found for '{query}'"
+
+    lines = [f"Found {count} podcast(s) matching '{query}':\n"]
+
+    for feed in feeds:
+        lines.append(f"\n**{feed.get('title', 'Unknown Title')}**")
+
+        lines.extend(_format_fields(feed, _FEED_FIELDS))
+        lines.extend(_format_fields(feed, _FEED_ID_FIELDS))
+
+    return "\n".join(lines)
+
+
+def format_episode_results(response: dict[str, Any]) -> str:
+    """
+    Format episode API response into readable text.
+
+    Args:
+        response: API response dictionary containing episode results
+
+    Returns:
+        Formatted string with episode search results including all available fields
+    """
+    count = response.get("count", 0)
+    items = response.get("items", [])
+    query = response.get("query", "")
+
+    if count == 0:
+        return f"No matches found for '{query}'"
+
+    lines = [f"Found {count} episode(s) matching '{query}':\n"]
+
+    for item in items:
+        lines.append(f"\n**{item.get('title', 'Unknown Title')}**")
+
+        lines.extend(_format_fields(item, _EPISODE_FIELDS))
+        lines.extend(_format_fields(item, _EPISODE_ID_FIELDS))
+
+    return "\n".join(lines)
+
+
+def format_podcast_details(response: dict[str, Any]) -> str:
+    """
+    Format podcast details API response into readable text.
+
+    Args:
+        response: API response dictionary containing podcast feed data
+
+    Returns:
+        Formatted string with podcast details including all available fields
+    """
+    feed = response.get("feed", {})
+
+    lines = [f"**{feed.get('title', 'Unknown Podcast')}**\n"]
+
+    lines.extend(_format_fields(feed, _FEED_FIELDS))
+
+    if "categories" in feed:
+        if isinstance(feed["categories"], dict):
+            categories = ", ".join(str(v) for v in feed["categories"].values())
+            lines.append(f"Categories: {categories}")
+        else:
+            lines.append(f"Categories: {feed['categories']}")
+
+    lines.extend(_format_fields(feed, _FEED_DETAIL_FIELDS))
+
+    return "\n".join(lines)
+
+
+def format_episode_details(response: dict[str, Any]) -> str:
+    """
+    Format episode details API response into readable text.
+
+    Args:
+        response: API response dictionary containing episode data
+
+    Returns:
+        Formatted string with episode details including all available fields
+    """
+    episode = response.get("episode", {})
+
+    lines = [f"**{episode.get('title', 'Unknown Episode')}**\n"]
+
+    lines.extend(_format_fields(episode, _EPISODE_FIELDS))
+    lines.extend(_format_fields(episode, _EPISODE_DETAIL_FIELDS))
+
+    if "persons" in episode:
+        persons_list = episode["persons"]
+        if persons_list:
+            lines.append("Persons:")
+            for person in persons_list:
+                name = person.get("name", "Unknown")
+                role = person.get("role", "")
+                if role:
+                    lines.append(f"  - {name} ({role})")
+                else:
+                    lines.append(f"  - {name}")
+
+    if "socialInteract" in episode:
+        social_list = episode["socialInteract"]
+        if social_list:
+            lines.append("Social Interactions:")
+            for social in social_list:
+                protocol = social.get("protocol", "Unknown")
+                uri = social.get("uri", "")
+                lines.append(f"  - {protocol}: {uri}")
+
+    lines.extend(_format_fields(episode, _EPISODE_ID_FIELDS))
+
+    return "\n".join(lines)
@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import os
-from datetime import timedelta
 from functools import wraps
 from typing import Any, Callable
 
@@ -11,6 +10,7 @@ import httpx
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
+from podcast_index.auth import load_credentials
 from podcast_index.client import (
     GetEpisodeDetailsParams,
     GetEpisodesParams,
@@ -18,6 +18,7 @@ from podcast_index.client import (
     SearchByPersonParams,
     SearchByTitleParams,
     SearchParams,
+    close_client,
     get_episode_details,
     get_episodes,
     get_podcast_details,
@@ -25,20 +26,33 @@ from podcast_index.client import (
     search_podcasts,
     search_podcasts_by_title,
 )
+from podcast_index.formatters import (
+    format_episode_details,
+    format_episode_results,
+    format_podcast_details,
+    format_search_results,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-_api_key = os.getenv("PODCAST_INDEX_API_KEY")
-_api_secret = os.getenv("PODCAST_INDEX_API_SECRET")
+CREDENTIALS = load_credentials(os.environ)
+
+
+def text_response(text: str) -> list[TextContent]:
+    """
+    Wrap text in a single-item MCP tool response.
+
+    Uses model_construct to skip pydantic validation: the content type is fixed and the
+    text is always a str built by this module, so validation can never fail here.
 
-if not _api_key or not _api_secret:
-    raise ValueError(
-        "PODCAST_INDEX_API_KEY and PODCAST_INDEX_API_SECRET environment variables must be set"
-    )
+    Args:
+        text: Response text to return to the client
 
-API_KEY: str = _api_key
-API_SECRET: str = _api_secret
+    Returns:
+        List containing one text TextContent
+    """
+    return [TextContent.model_construct(type="text", text=text)]
 
 
 def handle_api_errors(operation_name: str) -> Callable:
@@ -63,22 +77,21 @@ def handle_api_errors(operation_name: str) -> Callable:
                 if e.response.status_code == 401:
                     error_msg += ": Invalid API credentials"
                 logger.exception(f"HTTP status error during {operation_name}")
-                return [TextContent(type="text", text=f"Error: {error_msg}")]
+                return text_response(f"Error: {error_msg}")
+
+            except httpx.TimeoutException as e:
+                logger.exception(f"Timeout during {operation_name}")
+                return text_response(
+                    f"Error: Request timed out ({type(e).__name__}) while {operation_name}"
+                )
 
             except httpx.HTTPError:
                 logger.exception(f"HTTP error during {operation_name}")
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Error: Network error while {operation_name}",
-                    )
-                ]
+                return text_response(f"Error: Network error while {operation_name}")
 
             except Exception:
                 logger.exception(f"Unexpected error during {operation_name}")
-                return [
-                    TextContent(type="text", text="Error: An unexpected error occurred")
-                ]
+                return text_response("Error: An unexpected error occurred")
 
         return wrapper
 
@@ -484,9 +497,9 @@ async def search_podcasts_tool(arguments: dict[str, Any]) -> list[TextContent]:
     if "similar" in arguments:
         params["similar"] = arguments["similar"]
 
-    response = await search_podcasts(API_KEY, API_SECRET, params)
+    response = await search_podcasts(CREDENTIALS, params)
     formatted_result = format_search_results(response)
-    return [TextContent(type="text", text=formatted_result)]
+    return text_response(formatted_result)
 
 
 @handle_api_errors("podcast title search")
@@ -513,9 +526,9 @@ async def search_podcasts_by_title_tool(arguments: dict[str, Any]) -> list[TextC
     if "similar" in arguments:
         params["similar"] = arguments["similar"]
 
-    response = await search_podcasts_by_title(API_KEY, API_SECRET, params)
+    response = await search_podcasts_by_title(CREDENTIALS, params)
     formatted_result = format_search_results(response)
-    return [TextContent(type="text", text=formatted_result)]
+    return text_response(formatted_result)
 
 
 @handle_api_errors("episode search by person")
@@ -538,107 +551,9 @@ async def search_episodes_by_person_tool(
     if "fulltext" in arguments:
         params["fulltext"] = arguments["fulltext"]
 
-    response = await search_episodes_by_person(API_KEY, API_SECRET, params)
+    response = await search_episodes_by_person(CREDENTIALS, params)
     formatted_result = format_episode_results(response)
-    return [TextContent(type="text", text=formatted_result)]
-
-
-def _format_duration(seconds: int) -> str:
-    """
-    Convert seconds to human-readable duration format.
-
-    Args:
-        seconds: Duration in seconds
-
-    Returns:
-        Formatted duration string as MM:SS for durations under 1 hour,
-        or HH:MM:SS for durations 1 hour or longer
-    """
-    duration = timedelta(seconds=seconds)
-    total_secs = int(duration.total_seconds())
-    hours, remainder = divmod(total_secs, 3600)
-    minutes, secs = divmod(remainder, 60)
-
-    if hours > 0:
-        return f"{hours}:{minutes:02d}:{secs:02d}"
-    else:
-        return f"{minutes}:{secs:02d}"
-
-
-def format_episode_results(response: dict[str, Any]) -> str:
-    """
-    Format episode API response into readable text.
-
-    Args:
-        response: API response dictionary containing episode results
-
-    Returns:
-        Formatted string with episode search results including all available fields
-    """
-    count = response.get("count", 0)
-    items = response.get("items", [])
-    query = response.get("query", "")
-
-    if count == 0:
-        return f"No matches found for '{query}'"
-
-    lines = [f"Found {count} episode(s) matching '{query}':\n"]
-
-    for item in items:
-        lines.append(f"\n**{item.get('title', 'Unknown Title')}**")
-
-        if "feedTitle" in item:
-            lines.append(f"Podcast: {item['feedTitle']}")
-
-        if "feedAuthor" in item:
-            lines.append(f"Author: {item['feedAuthor']}")
-
-        if "description" in item:
-            lines.append(f"Description: {item['description']}")
-
-        if "datePublished" in item:
-            lines.append(f"Published: {item['datePublished']}")
-
-        if "datePublishedPretty" in item:
-            lines.append(f"Published Date: {item['datePublishedPretty']}")
-
-        if "duration" in item:
-            lines.append(f"Duration: {_format_duration(item['duration'])}")
-
-        if "link" in item:
-            lines.append(f"Episode URL: {item['link']}")
-
-        if "enclosureUrl" in item:
-            lines.append(f"Audio URL: {item['enclosureUrl']}")
-
-        if "enclosureType" in item:
-            lines.append(f"Audio Type: {item['enclosureType']}")
-
-        if "enclosureLength" in item:
-            lines.append(f"File Size: {item['enclosureLength']} bytes")
-
-        if "image" in item:
-            lines.append(f"Episode Image: {item['image']}")
-
-        if "feedImage" in item:
-            lines.append(f"Podcast Image: {item['feedImage']}")
-
-        if "feedUrl" in item:
-            lines.append(f"Feed URL: {item['feedUrl']}")
-
-        if "chaptersUrl" in item:
-            lines.append(f"Chapters: {item['chaptersUrl']}")
-
-        if "transcriptUrl" in item:
-            lines.append(f"Transcript: {item['transcriptUrl']}")
-
-        if "feedId" in item:
-            lines.append(f"Podcast ID: {item['feedId']}")
-
-        if "id" in item:
-            lines.append(f"Episode ID: {item['id']}")
-
-    return "\n".join(lines)
+    return text_response(formatted_result)
 
 
 @handle_api_errors("retrieving episodes")
@@ -661,111 +576,9 @@ async def get_episodes_tool(arguments: dict[str, Any]) -> list[TextContent]:
     if "fulltext" in arguments:
         params["fulltext"] = arguments["fulltext"]
 
-    response = await get_episodes(API_KEY, API_SECRET, params)
+    response = await get_episodes(CREDENTIALS, params)
     formatted_result = format_episode_results(response)
-    return [TextContent(type="text", text=formatted_result)]
-
-
-def format_podcast_details(response: dict[str, Any]) -> str:
-    """
-    Format podcast details API response into readable text.
-
-    Args:
-        response: API response dictionary containing podcast feed data
-
-    Returns:
-        Formatted string with podcast details including all available fields
-    """
-    feed = response.get("feed", {})
-
-    lines = [f"**{feed.get('title', 'Unknown Podcast')}**\n"]
-
-    if "author" in feed:
-        lines.append(f"Author: {feed['author']}")
-
-    if "ownerName" in feed:
-        lines.append(f"Owner: {feed['ownerName']}")
-
-    if "description" in feed:
-        lines.append(f"Description: {feed['description']}")
-
-    if "url" in feed:
-        lines.append(f"Feed URL: {feed['url']}")
-
-    if "originalUrl" in feed:
-        lines.append(f"Original Feed URL: {feed['originalUrl']}")
-
-    if "link" in feed:
-        lines.append(f"Website: {feed['link']}")
-
-    if "image" in feed:
-        lines.append(f"Image: {feed['image']}")
-
-    if "artwork" in feed:
-        lines.append(f"Artwork: {feed['artwork']}")
-
-    if "lastUpdateTime" in feed:
-        lines.append(f"Last Updated: {feed['lastUpdateTime']}")
-
-    if "lastCrawlTime" in feed:
-        lines.append(f"Last Crawled: {feed['lastCrawlTime']}")
-
-    if "lastParseTime" in feed:
-        lines.append(f"Last Parsed: {feed['lastParseTime']}")
-
-    if "lastGoodHttpStatusTime" in feed:
-        lines.append(f"Last Good HTTP Status: {feed['lastGoodHttpStatusTime']}")
-
-    if "lastHttpStatus" in feed:
-        lines.append(f"Last HTTP Status: {feed['lastHttpStatus']}")
-
-    if "contentType" in feed:
-        lines.append(f"Content Type: {feed['contentType']}")
-
-    if "itunesId" in feed:
-        lines.append(f"iTunes ID: {feed['itunesId']}")
-
-    if "generator" in feed:
-        lines.append(f"Generator: {feed['generator']}")
-
-    if "language" in feed:
-        lines.append(f"Language: {feed['language']}")
-
-    if "type" in feed:
-        lines.append(f"Type: {feed['type']}")
-
-    if "dead" in feed:
-        lines.append(f"Dead: {feed['dead']}")
-
-    if "crawlErrors" in feed:
-        lines.append(f"Crawl Errors: {feed['crawlErrors']}")
-
-    if "parseErrors" in feed:
-        lines.append(f"Parse Errors: {feed['parseErrors']}")
-
-    if "categories" in feed:
-        if isinstance(feed["categories"], dict):
-            categories = ", ".join(str(v) for v in feed["categories"].values())
-            lines.append(f"Categories: {categories}")
-        else:
-            lines.append(f"Categories: {feed['categories']}")
-
-    if "locked" in feed:
-        lines.append(f"Locked: {feed['locked']}")
-
-    if "explicit" in feed:
-        lines.append(f"Explicit: {feed['explicit']}")
-
-    if "episodeCount" in feed:
-        lines.append(f"Episode Count: {feed['episodeCount']}")
-
-    if "imageUrlHash" in feed:
-        lines.append(f"Image URL Hash: {feed['imageUrlHash']}")
-
-    if "id" in feed:
-        lines.append(f"Podcast Index ID: {feed['id']}")
-
-    return "\n".join(lines)
+    return text_response(formatted_result)
 
 
 @handle_api_errors("retrieving podcast details")
@@ -781,116 +594,9 @@ async def get_podcast_details_tool(arguments: dict[str, Any]) -> list[TextConten
     """
     params = GetPodcastDetailsParams(id=arguments["id"])
 
-    response = await get_podcast_details(API_KEY, API_SECRET, params)
+    response = await get_podcast_details(CREDENTIALS, params)
     formatted_result = format_podcast_details(response)
-    return [TextContent(type="text", text=formatted_result)]
-
-
-def format_episode_details(response: dict[str, Any]) -> str:
-    """
-    Format episode details API response into readable text.
-
-    Args:
-        response: API response dictionary containing episode data
-
-    Returns:
-        Formatted string with episode details including all available fields
-    """
-    episode = response.get("episode", {})
-
-    lines = [f"**{episode.get('title', 'Unknown Episode')}**\n"]
-
-    if "feedTitle" in episode:
-        lines.append(f"Podcast: {episode['feedTitle']}")
-
-    if "feedAuthor" in episode:
-        lines.append(f"Author: {episode['feedAuthor']}")
-
-    if "description" in episode:
-        lines.append(f"Description: {episode['description']}")
-
-    if "datePublished" in episode:
-        lines.append(f"Published: {episode['datePublished']}")
-
-    if "datePublishedPretty" in episode:
-        lines.append(f"Published Date: {episode['datePublishedPretty']}")
-
-    if "duration" in episode:
-        lines.append(f"Duration: {_format_duration(episode['duration'])}")
-
-    if "link" in episode:
-        lines.append(f"Episode URL: {episode['link']}")
-
-    if "enclosureUrl" in episode:
-        lines.append(f"Audio URL: {episode['enclosureUrl']}")
-
-    if "enclosureType" in episode:
-        lines.append(f"Audio Type: {episode['enclosureType']}")
-
-    if "enclosureLength" in episode:
-        lines.append(f"File Size: {episode['enclosureLength']} bytes")
-
-    if "image" in episode:
-        lines.append(f"Episode Image: {episode['image']}")
-
-    if "feedImage" in episode:
-        lines.append(f"Podcast Image: {episode['feedImage']}")
-
-    if "feedUrl" in episode:
-        lines.append(f"Feed URL: {episode['feedUrl']}")
-
-    if "chaptersUrl" in episode:
-        lines.append(f"Chapters: {episode['chaptersUrl']}")
-
-    if "transcriptUrl" in episode:
-        lines.append(f"Transcript: {episode['transcriptUrl']}")
-
-    if "season" in episode:
-        lines.append(f"Season: {episode['season']}")
-
-    if "episode" in episode:
-        lines.append(f"Episode: {episode['episode']}")
-
-    if "episodeType" in episode:
-        lines.append(f"Episode Type: {episode['episodeType']}")
-
-    if "explicit" in episode:
-        lines.append(f"Explicit: {episode['explicit']}")
-
-    if "feedItunesId" in episode:
-        lines.append(f"iTunes ID: {episode['feedItunesId']}")
-
-    if "feedLanguage" in episode:
-        lines.append(f"Language: {episode['feedLanguage']}")
-
-    if "persons" in episode:
-        persons_list = episode["persons"]
-        if persons_list:
-            lines.append("Persons:")
-            for person in persons_list:
-                name = person.get("name", "Unknown")
-                role = person.get("role", "")
-                if role:
-                    lines.append(f"  - {name} ({role})")
-                else:
-                    lines.append(f"  - {name}")
-
-    if "socialInteract" in episode:
-        social_list = episode["socialInteract"]
-        if social_list:
-            lines.append("Social Interactions:")
-            for social in social_list:
-                protocol = social.get("protocol", "Unknown")
-                uri = social.get("uri", "")
-                lines.append(f"  - {protocol}: {uri}")
-
-    if "feedId" in episode:
-        lines.append(f"Podcast ID: {episode['feedId']}")
-
-    if "id" in episode:
-        lines.append(f"Episode ID: {episode['id']}")
-
-    return "\n".join(lines)
+    return text_response(formatted_result)
 
 
 @handle_api_errors("retrieving episode details")
@@ -909,100 +615,9 @@ async def get_episode_details_tool(arguments: dict[str, Any]) -> list[TextConten
     if "fulltext" in arguments:
         params["fulltext"] = arguments["fulltext"]
 
-    response = await get_episode_details(API_KEY, API_SECRET, params)
+    response = await get_episode_details(CREDENTIALS, params)
     formatted_result = format_episode_details(response)
-    return [TextContent(type="text", text=formatted_result)]
-
-
-def format_search_results(response: dict[str, Any]) -> str:
-    """
-    Format API response into readable text.
-
-    Args:
-        response: API response dictionary
-
-    Returns:
-        Formatted string with search results including all available fields
-    """
-    count = response.get("count", 0)
-    feeds = response.get("feeds", [])
-    query = response.get("query", "")
-
-    if count == 0:
-        return f"No matches found for '{query}'"
-
-    lines = [f"Found {count} podcast(s) matching '{query}':\n"]
-
-    for feed in feeds:
-        lines.append(f"\n**{feed.get('title', 'Unknown Title')}**")
-
-        if "author" in feed:
-            lines.append(f"Author: {feed['author']}")
-
-        if "ownerName" in feed:
-            lines.append(f"Owner: {feed['ownerName']}")
-
-        if "description" in feed:
-            lines.append(f"Description: {feed['description']}")
-
-        if "url" in feed:
-            lines.append(f"Feed URL: {feed['url']}")
-
-        if "originalUrl" in feed:
-            lines.append(f"Original Feed URL: {feed['originalUrl']}")
-
-        if "link" in feed:
-            lines.append(f"Website: {feed['link']}")
-
-        if "image" in feed:
-            lines.append(f"Image: {feed['image']}")
-
-        if "artwork" in feed:
-            lines.append(f"Artwork: {feed['artwork']}")
-
-        if "lastUpdateTime" in feed:
-            lines.append(f"Last Updated: {feed['lastUpdateTime']}")
-
-        if "lastCrawlTime" in feed:
-            lines.append(f"Last Crawled: {feed['lastCrawlTime']}")
-
-        if "lastParseTime" in feed:
-            lines.append(f"Last Parsed: {feed['lastParseTime']}")
-
-        if "lastGoodHttpStatusTime" in feed:
-            lines.append(f"Last Good HTTP Status: {feed['lastGoodHttpStatusTime']}")
-
-        if "lastHttpStatus" in feed:
-            lines.append(f"Last HTTP Status: {feed['lastHttpStatus']}")
-
-        if "contentType" in feed:
-            lines.append(f"Content Type: {feed['contentType']}")
-
-        if "itunesId" in feed:
-            lines.append(f"iTunes ID: {feed['itunesId']}")
-
-        if "generator" in feed:
-            lines.append(f"Generator: {feed['generator']}")
-
-        if "language" in feed:
-            lines.append(f"Language: {feed['language']}")
-
-        if "type" in feed:
-            lines.append(f"Type: {feed['type']}")
-
-        if "dead" in feed:
-            lines.append(f"Dead: {feed['dead']}")
-
-        if "crawlErrors" in feed:
-            lines.append(f"Crawl Errors: {feed['crawlErrors']}")
-
-        if "parseErrors" in feed:
-            lines.append(f"Parse Errors: {feed['parseErrors']}")
-
-        if "id" in feed:
-            lines.append(f"Podcast Index ID: {feed['id']}")
-
-    return "\n".join(lines)
+    return text_response(formatted_result)
 
 
 async def run_server():
@@ -1011,10 +626,13 @@ async def run_server():
 
     server = create_server()
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        await close_client()
 
 
 def main():
@@ -0,0 +1,148 @@
+import os
+from typing import Any
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from podcast_index.client import clear_response_cache
+
+# podcast_index.main loads credentials at import time, so they must be set
+# before any test module imports it
+os.environ.setdefault("PODCAST_INDEX_API_KEY", "test_key")
+os.environ.setdefault("PODCAST_INDEX_API_SECRET", "test_secret")
+
+# Canned Podcast Index API payloads served by the mock transport, keyed by request path
+API_RESPONSES = {
+    "/api/1.0/search/byterm": {
+        "status": "true",
+        "feeds": [
+            {
+                "id": 123,
+                "title": "Test Podcast",
+                "url": "https://example.com/feed",
+                "description": "A test podcast",
+            }
+        ],
+        "count": 1,
+        "query": "test",
+        "description": "Found 1 match",
+    },
+    "/api/1.0/search/bytitle": {
+        "status": "true",
+        "feeds": [
+            {
+                "id": 456,
+                "title": "Serial",
+                "url": "https://example.com/serial",
+                "description": "The Serial podcast",
+            }
+        ],
+        "count": 1,
+        "query": "Serial",
+        "description": "Found 1 match",
+    },
+    "/api/1.0/search/byperson": {
+        "status": "true",
+        "items": [
+            {
+                "id": 789,
+                "title": "Episode about Adam Curry",
+                "feedTitle": "No Agenda",
+                "description": "Discussing Adam Curry",
+            }
+        ],
+        "count": 1,
+        "query": "Adam Curry",
+        "description": "Found 1 match",
+    },
+    "/api/1.0/episodes/byfeedid": {
+        "status": "true",
+        "items": [
+            {
+                "id": 789,
+                "title": "Episode 1",
+                "description": "First episode",
+                "datePublished": 1609459200,
+            }
+        ],
+        "count": 1,
+    },
+    "/api/1.0/podcasts/byfeedid": {
+        "status": "true",
+        "feed": {
+            "id": 920666,
+            "title": "No Agenda",
+            "description": "The best podcast in the universe",
+            "url": "https://example.com/feed",
+        },
+    },
+    "/api/1.0/episodes/byid": {
+        "status": "true",
+        "episode": {
+            "id": 16795090,
+            "title": "Special Episode",
+            "description": "An amazing episode",
+            "feedId": 920666,
+        },
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache():
+    """Start every test with an empty response cache so mocked responses are used."""
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
+def _handle_api_request(request: httpx.Request) -> httpx.Response:
+    """Answer a request with the canned payload for its endpoint."""
+    return httpx.Response(200, json=API_RESPONSES[request.url.path])
+
+
+@pytest.fixture(scope="session")
+def mock_transport():
+    """Transport that serves canned API responses without touching the network."""
+    return httpx.MockTransport(_handle_api_request)
+
+
+@pytest.fixture
+def api_responses():
+    """Canned API payloads served by mock_transport, keyed by request path."""
+    return API_RESPONSES
+
+
+@pytest.fixture
+async def api_client(mock_transport):
+    """Real AsyncClient backed by mock_transport, for injecting into API calls."""
+    async with httpx.AsyncClient(transport=mock_transport) as client:
+        yield client
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """AsyncMock installed as the shared HTTP client returned by get_client."""
+    client = AsyncMock()
+    monkeypatch.setattr("podcast_index.client.get_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def mock_api_call(monkeypatch):
+    """Factory that replaces a client function imported by podcast_index.main with an AsyncMock."""
+
+    def install(name: str, **kwargs: Any) -> AsyncMock:
+        mock = AsyncMock(**kwargs)
+        monkeypatch.setattr(f"podcast_index.main.{name}", mock)
+        return mock
+
+    return install
+
+
+@pytest.fixture
+def shared_api_client(monkeypatch, api_client):
+    """Route calls made through the shared client to mock_transport, end to end."""
+    monkeypatch.setattr("podcast_index.client.get_client", lambda: api_client)
+    return api_client
@@ -1,7 +1,24 @@
+import hashlib
 from unittest.mock import patch
 
+import pytest
 
-from podcast_index.auth import generate_auth_headers
+import podcast_index.auth
+from podcast_index.auth import (
+    Credentials,
+    _auth_hash_prefix,
+    generate_auth_headers,
+    load_credentials,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_auth_caches(monkeypatch):
+    """Start every test with no cached credential hash or headers."""
+    _auth_hash_prefix.cache_clear()
+    monkeypatch.setattr(podcast_index.auth, "_headers_cache", None)
+    yield
+    _auth_hash_prefix.cache_clear()
 
 
 def test_generate_auth_headers_includes_required_headers():
@@ -45,9 +62,6 @@ def test_generate_auth_headers_creates_valid_authorization_hash():
     timestamp = "1234567890"
 
     # Expected: SHA-1 of "test_keytest_secret1234567890"
-    # Using Python's hashlib to compute expected value
-    import hashlib
-
     expected_hash = hashlib.sha1(
         f"{api_key}{api_secret}{timestamp}".encode()
     ).hexdigest()
@@ -92,3 +106,89 @@ def test_generate_auth_headers_different_timestamps_produce_different_hashes():
 
     assert headers1["Authorization"] != headers2["Authorization"]
     assert headers1["X-Auth-Date"] != headers2["X-Auth-Date"]
+
+
+def test_generate_auth_headers_reuses_hash_within_same_second():
+    """Repeated calls in the same second should compute the SHA-1 signature once."""
+    with (
+        patch("time.time", return_value=1500000000.2),
+        patch("podcast_index.auth.hashlib.sha1", wraps=hashlib.sha1) as mock_sha1,
+    ):
+        headers1 = generate_auth_headers("burst_key", "burst_secret")
+        headers2 = generate_auth_headers("burst_key", "burst_secret")
+
+    assert headers1 == headers2
+    assert mock_sha1.call_count == 1
+
+
+def test_generate_auth_headers_hashes_credentials_once_across_seconds():
+    """New timestamps should extend the cached credential hash instead of rehashing it."""
+    expected = [
+        hashlib.sha1(f"prefix_keyprefix_secret{timestamp}".encode()).hexdigest()
+        for timestamp in (1600000000, 1600000001)
+    ]
+
+    with patch("podcast_index.auth.hashlib.sha1", wraps=hashlib.sha1) as mock_sha1:
+        with patch("time.time", return_value=1600000000.0):
+            headers1 = generate_auth_headers("prefix_key", "prefix_secret")
+        with patch("time.time", return_value=1600000001.0):
+            headers2 = generate_auth_headers("prefix_key", "prefix_secret")
+
+    assert [headers1["Authorization"], headers2["Authorization"]] == expected
+    assert mock_sha1.call_count == 1
+
+
+def test_generate_auth_headers_recomputes_for_different_credentials():
+    """Cached headers must not be reused for a different key or secret."""
+    with patch("time.time", return_value=1500000000.0):
+        headers1 = generate_auth_headers("key_one", "secret")
+        headers2 = generate_auth_headers("key_two", "secret")
+        headers3 = generate_auth_headers("key_two", "other_secret")
+
+    assert headers2["X-Auth-Key"] == "key_two"
+    assert headers1["Authorization"] != headers2["Authorization"]
+    assert headers2["Authorization"] != headers3["Authorization"]
+
+
+def test_generate_auth_headers_returns_independent_dicts():
+    """Mutating returned headers should not affect later calls."""
+    with patch("time.time", return_value=1500000000.0):
+        headers1 = generate_auth_headers("key", "secret")
+        headers1["Authorization"] = "tampered"
+        headers2 = generate_auth_headers("key", "secret")
+
+    assert headers2["Authorization"] != "tampered"
+
+
+def test_load_credentials_reads_environment():
+    """load_credentials should build Credentials from the API key and secret variables."""
+    environ = {
+        "PODCAST_INDEX_API_KEY": "env_key",
+        "PODCAST_INDEX_API_SECRET": "env_secret",
+    }
+
+    credentials = load_credentials(environ)
+
+    assert credentials == Credentials(api_key="env_key", api_secret="env_secret")
+
+
+@pytest.mark.parametrize(
+    "environ",
+    [
+        {},
+        {"PODCAST_INDEX_API_KEY": "key"},
+        {"PODCAST_INDEX_API_SECRET": "secret"},
+        {"PODCAST_INDEX_API_KEY": "", "PODCAST_INDEX_API_SECRET": "secret"},
+    ],
+)
+def test_load_credentials_rejects_missing_values(environ):
+    """load_credentials should raise ValueError when either variable is missing or empty."""
+    with pytest.raises(ValueError, match="PODCAST_INDEX_API_KEY"):
+        load_credentials(environ)
+
+
+def test_credentials_repr_hides_secret():
+    """Credentials repr should never expose the API secret."""
+    credentials = Credentials(api_key="key", api_secret="super_secret")
+
+    assert "super_secret" not in repr(credentials)
@@ -1,9 +1,21 @@
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import gc
+import weakref
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import httpx
 import pytest
 
+from podcast_index.auth import Credentials
 from podcast_index.client import (
+    EPISODE_BY_ID,
+    HTTP_TIMEOUT,
+    MAX_RETRIES,
+    MAX_CONCURRENT_REQUESTS,
+    RESPONSE_CACHE_MAXSIZE,
+    RETRY_MAX_DELAY,
+    Endpoint,
     GetEpisodeDetailsParams,
     GetEpisodesParams,
     GetPodcastDetailsParams,
@@ -16,22 +28,52 @@ from podcast_index.client import (
     build_search_by_person_url,
     build_search_by_title_url,
     build_search_url,
+    build_url,
+    close_client,
+    configure_concurrency,
     get_client,
     get_episode_details,
+    get_episode_details_many,
     get_episodes,
     get_podcast_details,
+    get_podcast_details_many,
+    get_request_semaphore,
+    retry_delay,
     search_episodes_by_person,
     search_podcasts,
     search_podcasts_by_title,
+    search_podcasts_many,
 )
 import podcast_index.client
 
 
-def test_get_client_reuses_same_client():
-    """get_client should return the same client instance on subsequent calls (singleton pattern)."""
-    # Reset the client to ensure clean state
+def _api_response(status_code: int, **kwargs) -> httpx.Response:
+    """Build a real httpx.Response bound to a request so raise_for_status works."""
+    request = httpx.Request("GET", "https://api.podcastindex.org/api/1.0/test")
+    return httpx.Response(status_code, request=request, **kwargs)
+
+
+def _assert_auth_headers(headers: dict[str, str], api_key: str) -> None:
+    """Assert a request carries the Podcast Index authentication headers."""
+    assert headers["X-Auth-Key"] == api_key
+    assert {"X-Auth-Date", "Authorization", "User-Agent"} <= headers.keys()
+
+
+def _query_params(url: str) -> dict[str, str]:
+    """Parse a URL's query string into a dict of decoded parameter values."""
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+@pytest.fixture
+async def fresh_shared_client():
+    """Start with no shared client and close whichever one the test created."""
     podcast_index.client._http_client = None
+    yield
+    await close_client()
 
+
+def test_get_client_reuses_same_client(fresh_shared_client):
+    """get_client should return the same client instance on subsequent calls (singleton pattern)."""
     client1 = get_client()
     client2 = get_client()
     client3 = get_client()
@@ -41,233 +83,231 @@ def test_get_client_reuses_same_client():
     assert client2 is client3
 
 
-def test_build_search_url_with_required_params():
-    """Search URL should include base URL and query parameter."""
-    params = SearchParams(q="python programming")
-
-    url = build_search_url(params)
-
-    assert url.startswith("https://api.podcastindex.org/api/1.0/search/byterm")
-    assert "q=python+programming" in url or "q=python%20programming" in url
-
-
-def test_build_search_url_with_max_results():
-    """Search URL should include max parameter when specified."""
-    params = SearchParams(q="test", max=50)
+def test_get_client_enables_http2(fresh_shared_client):
+    """get_client should create the shared client with HTTP/2 multiplexing enabled."""
+    with patch(
+        "podcast_index.client.httpx.AsyncClient", autospec=True
+    ) as mock_client_class:
+        get_client()
+
+    assert mock_client_class.call_args.kwargs["http2"] is True
+
+
+def test_get_client_keeps_idle_connections_alive_between_tool_calls(
+    fresh_shared_client,
+):
+    """get_client should configure a pool that keeps connections warm between tool calls."""
+    with patch(
+        "podcast_index.client.httpx.AsyncClient", autospec=True
+    ) as mock_client_class:
+        get_client()
+
+    limits = mock_client_class.call_args.kwargs["limits"]
+    assert limits.keepalive_expiry >= 30.0
+    assert limits.max_keepalive_connections == limits.max_connections
+
+
+def test_get_client_sets_per_stage_timeouts(fresh_shared_client):
+    """get_client should bound connect, read, write, and pool waits separately."""
+    with patch(
+        "podcast_index.client.httpx.AsyncClient", autospec=True
+    ) as mock_client_class:
+        get_client()
+
+    timeout = mock_client_class.call_args.kwargs["timeout"]
+    assert timeout == HTTP_TIMEOUT
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (
+        3.0,
+        10.0,
+        5.0,
+        2.0,
+    )
 
-    url = build_search_url(params)
 
-    assert "max=50" in url
+async def test_get_client_creates_new_client_after_fork(fresh_shared_client):
+    """A child process should not reuse the client (and sockets) created by its parent."""
+    parent_client = get_client()
 
+    with patch("podcast_index.client.os.getpid", return_value=-1):
+        child_client = get_client()
 
-def test_build_search_url_with_value_filter():
-    """Search URL should include val parameter for value block filtering."""
-    params = SearchParams(q="test", val="lightning")
+        assert child_client is not parent_client
+        assert get_client() is child_client
+    await parent_client.aclose()
 
-    url = build_search_url(params)
 
-    assert "val=lightning" in url
+async def test_close_client_closes_and_resets_shared_client(fresh_shared_client):
+    """close_client should close the shared client so the next call creates a new one."""
+    client = get_client()
 
+    await close_client()
 
-def test_build_search_url_with_boolean_flags():
-    """Search URL should include boolean flags when enabled."""
-    params = SearchParams(q="test", clean=True, fulltext=True, aponly=True)
+    assert client.is_closed
+    assert get_client() is not client
 
-    url = build_search_url(params)
 
-    assert "clean=true" in url.lower()
-    assert "fulltext=true" in url.lower()
-    assert "aponly=true" in url.lower()
+async def test_close_client_without_client_is_noop(fresh_shared_client):
+    """close_client should do nothing when no client has been created."""
+    await close_client()
 
+    assert podcast_index.client._http_client is None
 
-def test_build_search_url_omits_false_boolean_flags():
-    """Search URL should not include boolean flags when False."""
-    params = SearchParams(q="test", clean=False, fulltext=False)
 
-    url = build_search_url(params)
+async def test_api_calls_share_one_client(fresh_shared_client):
+    """Different endpoints should reuse the shared client rather than creating their own."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    with patch(
+        "podcast_index.client.httpx.AsyncClient", autospec=True
+    ) as mock_client_class:
+        mock_client_class.return_value.get = AsyncMock(
+            side_effect=lambda *args, **kwargs: _api_response(200, json={})
+        )
+        await search_podcasts(credentials, SearchParams(q="test"))
+        await get_episodes(credentials, GetEpisodesParams(id=1))
 
-    assert "clean" not in url
-    assert "fulltext" not in url
+    mock_client_class.assert_called_once()
+    assert mock_client_class.return_value.get.await_count == 2
 
 
-def test_build_search_url_with_all_params():
-    """Search URL should include all parameters when provided."""
-    params = SearchParams(
-        q="test query",
-        max=100,
-        val="lightning",
-        clean=True,
-        similar=True,
-        fulltext=True,
-        aponly=True,
+def test_build_url_orders_required_optional_then_flags():
+    """build_url should emit required params, then present optional params, then true flags."""
+    endpoint = Endpoint(
+        path="/test/path", required=("q",), optional=("max",), flags=("clean",)
     )
 
-    url = build_search_url(params)
+    url = build_url(endpoint, {"clean": True, "max": 5, "q": "x"})
 
-    assert "q=test" in url
-    assert "max=100" in url
-    assert "val=lightning" in url
-    assert "clean=true" in url.lower()
-    assert "similar=true" in url.lower()
-    assert "fulltext=true" in url.lower()
-    assert "aponly=true" in url.lower()
+    assert url == "https://api.podcastindex.org/api/1.0/test/path?q=x&max=5&clean=true"
 
 
-@pytest.mark.asyncio
-async def test_search_podcasts_makes_request_with_auth_headers():
-    """search_podcasts should make HTTP request with authentication headers."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchParams(q="test")
+def test_endpoint_precomputes_absolute_url():
+    """Endpoint should derive its absolute URL from the path once at construction."""
+    endpoint = Endpoint(path="/search/byterm", required=("q",))
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "true",
-        "feeds": [],
-        "count": 0,
-        "query": "test",
-        "description": "Found matches for 'test'",
-    }
+    assert endpoint.url == "https://api.podcastindex.org/api/1.0/search/byterm"
 
-    mock_client = AsyncMock()
-    mock_client.get.return_value = mock_response
-
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        await search_podcasts(api_key, api_secret, params)
 
-        mock_client.get.assert_called_once()
-        call_args = mock_client.get.call_args
+def test_build_url_ignores_params_the_endpoint_does_not_accept():
+    """build_url should drop keys that are not part of the endpoint layout."""
+    endpoint = Endpoint(path="/test/path", required=("id",))
 
-        headers = call_args.kwargs["headers"]
-        assert headers["X-Auth-Key"] == api_key
-        assert "X-Auth-Date" in headers
-        assert "Authorization" in headers
-        assert "User-Agent" in headers
+    url = build_url(endpoint, {"id": 1, "fulltext": True, "max": 10})
 
+    assert url.endswith("/test/path?id=1")
 
-@pytest.mark.asyncio
-async def test_search_podcasts_returns_successful_response():
-    """search_podcasts should return parsed response data."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchParams(q="test")
 
-    expected_response = {
-        "status": "true",
-        "feeds": [
-            {
-                "id": 123,
-                "title": "Test Podcast",
-                "url": "https://example.com/feed",
-                "description": "A test podcast",
-            }
-        ],
-        "count": 1,
-        "query": "test",
-        "description": "Found 1 match",
-    }
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"q": "plain"},
+        {"q": "a&b=c?d#e", "max": 10},
+        {"q": "Ünïcode spaces / slashes", "val": "any"},
+        {"q": "floats", "max": 10.0},
+    ],
+)
+def test_build_url_encodes_like_urlencode(params):
+    """build_url should produce the same query string as urllib's urlencode."""
+    endpoint = Endpoint(path="/test/path", required=("q",), optional=("max", "val"))
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
+    url = build_url(endpoint, params)
 
-    mock_client = AsyncMock()
-    mock_client.get.return_value = mock_response
+    assert url == f"{endpoint.url}?{urlencode(params)}"
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await search_podcasts(api_key, api_secret, params)
 
-        assert result == expected_response
-        assert result["count"] == 1
-        assert len(result["feeds"]) == 1
+def test_build_url_accepts_float_values_for_integer_params():
+    """Floats that pass JSON schema integer validation should encode instead of raising."""
+    url = build_url(EPISODE_BY_ID, {"id": 920666.0})
 
+    assert _query_params(url) == {"id": "920666.0"}
 
-@pytest.mark.asyncio
-async def test_search_podcasts_handles_http_errors():
-    """search_podcasts should raise exception for HTTP errors."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchParams(q="test")
 
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = httpx.HTTPError("Network error")
+def test_build_url_quotes_string_values_to_prevent_injection():
+    """String values should be quoted so they cannot add extra query parameters."""
+    url = build_url(Endpoint(path="/test/path", required=("id",)), {"id": "1&max=1000"})
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPError):
-            await search_podcasts(api_key, api_secret, params)
+    assert url.endswith("?id=1%26max%3D1000")
 
 
-@pytest.mark.asyncio
-async def test_search_podcasts_handles_unauthorized():
-    """search_podcasts should handle 401 unauthorized responses."""
-    api_key = "invalid_key"
-    api_secret = "invalid_secret"
-    params = SearchParams(q="test")
+def test_build_url_requires_required_params():
+    """build_url should raise KeyError when a required parameter is missing."""
+    endpoint = Endpoint(path="/test/path", required=("q",))
 
-    mock_response = Mock()
-    mock_response.status_code = 401
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "Unauthorized", request=Mock(), response=mock_response
-    )
+    with pytest.raises(KeyError):
+        build_url(endpoint, {})
 
-    mock_client = AsyncMock()
 
-    mock_client.get.return_value = mock_response
+def test_build_search_url_with_required_params():
+    """Search URL should include base URL and query parameter."""
+    params = SearchParams(q="python programming")
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPStatusError):
-            await search_podcasts(api_key, api_secret, params)
+    url = build_search_url(params)
 
+    assert url.startswith("https://api.podcastindex.org/api/1.0/search/byterm")
+    assert _query_params(url) == {"q": "python programming"}
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        (SearchParams(q="test", max=50), {"max": "50"}),
+        (SearchParams(q="test", val="lightning"), {"val": "lightning"}),
+        (
+            SearchParams(q="test", clean=True, fulltext=True, aponly=True),
+            {"clean": "true", "fulltext": "true", "aponly": "true"},
+        ),
+        (
+            SearchParams(
+                q="test query",
+                max=100,
+                val="lightning",
+                clean=True,
+                similar=True,
+                fulltext=True,
+                aponly=True,
+            ),
+            {
+                "q": "test query",
+                "max": "100",
+                "val": "lightning",
+                "clean": "true",
+                "similar": "true",
+                "fulltext": "true",
+                "aponly": "true",
+            },
+        ),
+    ],
+)
+def test_build_search_url_includes_given_params(params, expected):
+    """Search URL should include each provided parameter and enabled flag."""
+    query = _query_params(build_search_url(params))
 
-@pytest.mark.asyncio
-async def test_search_podcasts_with_empty_results():
-    """search_podcasts should handle empty search results."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchParams(q="nonexistent")
+    assert query.items() >= expected.items()
 
-    expected_response = {
-        "status": "true",
-        "feeds": [],
-        "count": 0,
-        "query": "nonexistent",
-        "description": "No matches found",
-    }
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
+async def test_search_podcasts_handles_unauthorized(mock_client):
+    """search_podcasts should handle 401 unauthorized responses."""
+    credentials = Credentials(api_key="invalid_key", api_secret="invalid_secret")
+    params = SearchParams(q="test")
 
-    mock_client = AsyncMock()
+    mock_response = _api_response(401)
 
     mock_client.get.return_value = mock_response
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await search_podcasts(api_key, api_secret, params)
-
-        assert result["count"] == 0
-        assert result["feeds"] == []
+    with pytest.raises(httpx.HTTPStatusError):
+        await search_podcasts(credentials, params)
 
 
-@pytest.mark.asyncio
-async def test_search_podcasts_handles_malformed_json():
+async def test_search_podcasts_handles_malformed_json(mock_client):
     """search_podcasts should raise exception when API returns invalid JSON."""
-    api_key = "test_key"
-    api_secret = "test_secret"
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
     params = SearchParams(q="test")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.side_effect = ValueError("Invalid JSON")
-
-    mock_client = AsyncMock()
+    mock_response = _api_response(200, content=b"<html>not json</html>")
 
     mock_client.get.return_value = mock_response
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(ValueError):
-            await search_podcasts(api_key, api_secret, params)
+    with pytest.raises(ValueError):
+        await search_podcasts(credentials, params)
 
 
 def test_build_search_by_title_url_with_required_params():
@@ -277,547 +317,650 @@ def test_build_search_by_title_url_with_required_params():
     url = build_search_by_title_url(params)
 
     assert url.startswith("https://api.podcastindex.org/api/1.0/search/bytitle")
-    assert "q=Serial" in url
-
-
-def test_build_search_by_title_url_with_max_results():
-    """Search by title URL should include max parameter when specified."""
-    params = SearchByTitleParams(q="test", max=25)
-
-    url = build_search_by_title_url(params)
-
-    assert "max=25" in url
-
-
-def test_build_search_by_title_url_with_value_filter():
-    """Search by title URL should include val parameter for value block filtering."""
-    params = SearchByTitleParams(q="test", val="lightning")
-
-    url = build_search_by_title_url(params)
-
-    assert "val=lightning" in url
-
-
-def test_build_search_by_title_url_with_boolean_flags():
-    """Search by title URL should include boolean flags when enabled."""
-    params = SearchByTitleParams(q="test", clean=True, fulltext=True, similar=True)
-
-    url = build_search_by_title_url(params)
-
-    assert "clean=true" in url.lower()
-    assert "fulltext=true" in url.lower()
-    assert "similar=true" in url.lower()
-
-
-def test_build_search_by_title_url_omits_false_boolean_flags():
-    """Search by title URL should not include boolean flags when False."""
-    params = SearchByTitleParams(q="test", clean=False, fulltext=False)
-
-    url = build_search_by_title_url(params)
+    assert _query_params(url) == {"q": "Serial"}
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        (SearchByTitleParams(q="test", max=25), {"max": "25"}),
+        (SearchByTitleParams(q="test", val="lightning"), {"val": "lightning"}),
+        (
+            SearchByTitleParams(q="test", clean=True, fulltext=True, similar=True),
+            {"clean": "true", "fulltext": "true", "similar": "true"},
+        ),
+        (
+            SearchByTitleParams(
+                q="test query",
+                max=50,
+                val="lightning",
+                clean=True,
+                similar=True,
+                fulltext=True,
+            ),
+            {
+                "q": "test query",
+                "max": "50",
+                "val": "lightning",
+                "clean": "true",
+                "similar": "true",
+                "fulltext": "true",
+            },
+        ),
+    ],
+)
+def test_build_search_by_title_url_includes_given_params(params, expected):
+    """Search by title URL should include each provided parameter and enabled flag."""
+    query = _query_params(build_search_by_title_url(params))
 
-    assert "clean" not in url
-    assert "fulltext" not in url
+    assert query.items() >= expected.items()
 
 
-def test_build_search_by_title_url_with_all_params():
-    """Search by title URL should include all parameters when provided."""
-    params = SearchByTitleParams(
-        q="test query",
-        max=50,
-        val="lightning",
-        clean=True,
-        similar=True,
-        fulltext=True,
-    )
+def test_build_search_by_person_url_with_required_params():
+    """Search by person URL should include base URL and query parameter."""
+    params = SearchByPersonParams(q="Adam Curry")
 
-    url = build_search_by_title_url(params)
+    url = build_search_by_person_url(params)
 
-    assert "q=test" in url
-    assert "max=50" in url
-    assert "val=lightning" in url
-    assert "clean=true" in url.lower()
-    assert "similar=true" in url.lower()
-    assert "fulltext=true" in url.lower()
+    assert url.startswith("https://api.podcastindex.org/api/1.0/search/byperson")
+    assert _query_params(url) == {"q": "Adam Curry"}
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        (SearchByPersonParams(q="test", max=30), {"max": "30"}),
+        (SearchByPersonParams(q="test", fulltext=True), {"fulltext": "true"}),
+        (
+            SearchByPersonParams(q="Adam Curry", max=50, fulltext=True),
+            {"q": "Adam Curry", "max": "50", "fulltext": "true"},
+        ),
+    ],
+)
+def test_build_search_by_person_url_includes_given_params(params, expected):
+    """Search by person URL should include each provided parameter and enabled flag."""
+    query = _query_params(build_search_by_person_url(params))
+
+    assert query.items() >= expected.items()
+
+
+@pytest.mark.parametrize(
+    ("build", "params"),
+    [
+        (build_search_url, SearchParams(q="test", clean=False, fulltext=False)),
+        (
+            build_search_by_title_url,
+            SearchByTitleParams(q="test", clean=False, fulltext=False),
+        ),
+        (build_search_by_person_url, SearchByPersonParams(q="test", fulltext=False)),
+    ],
+)
+def test_build_search_urls_omit_false_boolean_flags(build, params):
+    """Search URLs should not include boolean flags when False."""
+    url = build(params)
 
+    assert _query_params(url) == {"q": "test"}
 
-@pytest.mark.asyncio
-async def test_search_podcasts_by_title_makes_request_with_auth_headers():
-    """search_podcasts_by_title should make HTTP request with authentication headers."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByTitleParams(q="Serial")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "true",
-        "feeds": [],
-        "count": 0,
-        "query": "Serial",
-        "description": "Found matches for 'Serial'",
-    }
+def test_build_episodes_url_with_required_params():
+    """Episodes by feed ID URL should include base URL and ID parameter."""
+    params = GetEpisodesParams(id=123456)
 
-    mock_client = AsyncMock()
+    url = build_episodes_url(params)
 
-    mock_client.get.return_value = mock_response
+    assert url.startswith("https://api.podcastindex.org/api/1.0/episodes/byfeedid")
+    assert _query_params(url) == {"id": "123456"}
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        (
+            GetEpisodesParams(id=123, since=1609459200),
+            {"id": "123", "since": "1609459200"},
+        ),
+        (
+            GetEpisodesParams(id=123, since=1609459200, max=50, fulltext=True),
+            {"id": "123", "since": "1609459200", "max": "50", "fulltext": "true"},
+        ),
+    ],
+)
+def test_build_episodes_url_includes_given_params(params, expected):
+    """Episodes by feed ID URL should include each provided parameter and enabled flag."""
+    query = _query_params(build_episodes_url(params))
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        await search_podcasts_by_title(api_key, api_secret, params)
+    assert query.items() >= expected.items()
 
-        mock_client.get.assert_called_once()
-        call_args = mock_client.get.call_args
 
-        headers = call_args.kwargs["headers"]
-        assert headers["X-Auth-Key"] == api_key
-        assert "X-Auth-Date" in headers
-        assert "Authorization" in headers
-        assert "User-Agent" in headers
+def test_build_podcast_details_url_with_required_params():
+    """Podcast details URL should include base URL and ID parameter."""
+    params = GetPodcastDetailsParams(id=920666)
 
+    url = build_podcast_details_url(params)
 
-@pytest.mark.asyncio
-async def test_search_podcasts_by_title_returns_successful_response():
-    """search_podcasts_by_title should return parsed response data."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByTitleParams(q="Serial")
+    assert url.startswith("https://api.podcastindex.org/api/1.0/podcasts/byfeedid")
+    assert _query_params(url) == {"id": "920666"}
 
-    expected_response = {
-        "status": "true",
-        "feeds": [
-            {
-                "id": 456,
-                "title": "Serial",
-                "url": "https://example.com/serial",
-                "description": "The Serial podcast",
-            }
-        ],
-        "count": 1,
-        "query": "Serial",
-        "description": "Found 1 match",
-    }
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
+def test_build_episode_details_url_with_required_params():
+    """Episode details URL should include base URL and ID parameter."""
+    params = GetEpisodeDetailsParams(id=16795090)
 
-    mock_client = AsyncMock()
+    url = build_episode_details_url(params)
 
-    mock_client.get.return_value = mock_response
+    assert url.startswith("https://api.podcastindex.org/api/1.0/episodes/byid")
+    assert _query_params(url) == {"id": "16795090"}
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await search_podcasts_by_title(api_key, api_secret, params)
 
-        assert result == expected_response
-        assert result["count"] == 1
-        assert len(result["feeds"]) == 1
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        (
+            GetEpisodeDetailsParams(id=123, fulltext=True),
+            {"id": "123", "fulltext": "true"},
+        ),
+    ],
+)
+def test_build_episode_details_url_includes_given_params(params, expected):
+    """Episode details URL should include the ID and fulltext flag when enabled."""
+    query = _query_params(build_episode_details_url(params))
+
+    assert query.items() >= expected.items()
+
+
+@pytest.mark.parametrize(
+    ("call", "params"),
+    [
+        (search_podcasts, SearchParams(q="test")),
+        (search_podcasts_by_title, SearchByTitleParams(q="Serial")),
+        (search_episodes_by_person, SearchByPersonParams(q="Adam Curry")),
+        (get_episodes, GetEpisodesParams(id=123456)),
+        (get_podcast_details, GetPodcastDetailsParams(id=920666)),
+        (get_episode_details, GetEpisodeDetailsParams(id=16795090)),
+    ],
+)
+async def test_api_calls_send_auth_headers(call, params, mock_client):
+    """Each API call should make one request carrying the authentication headers."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    mock_client.get.return_value = _api_response(200, json={"status": "true"})
 
+    await call(credentials, params)
 
-@pytest.mark.asyncio
-async def test_search_podcasts_by_title_handles_http_errors():
-    """search_podcasts_by_title should raise exception for HTTP errors."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByTitleParams(q="test")
+    mock_client.get.assert_called_once()
+    _assert_auth_headers(
+        mock_client.get.call_args.kwargs["headers"], credentials.api_key
+    )
 
-    mock_client = AsyncMock()
 
+@pytest.mark.parametrize(
+    ("call", "params", "path"),
+    [
+        (search_podcasts, SearchParams(q="test"), "/api/1.0/search/byterm"),
+        (
+            search_podcasts_by_title,
+            SearchByTitleParams(q="Serial"),
+            "/api/1.0/search/bytitle",
+        ),
+        (
+            search_episodes_by_person,
+            SearchByPersonParams(q="Adam Curry"),
+            "/api/1.0/search/byperson",
+        ),
+        (get_episodes, GetEpisodesParams(id=123456), "/api/1.0/episodes/byfeedid"),
+        (
+            get_podcast_details,
+            GetPodcastDetailsParams(id=920666),
+            "/api/1.0/podcasts/byfeedid",
+        ),
+        (
+            get_episode_details,
+            GetEpisodeDetailsParams(id=16795090),
+            "/api/1.0/episodes/byid",
+        ),
+    ],
+)
+async def test_api_calls_return_parsed_response(
+    call, params, path, api_client, api_responses
+):
+    """Each API call should request its endpoint and return the decoded response."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+
+    result = await call(credentials, params, client=api_client)
+
+    assert result == api_responses[path]
+
+
+@pytest.mark.parametrize(
+    ("call", "params"),
+    [
+        (search_podcasts, SearchParams(q="test")),
+        (search_podcasts_by_title, SearchByTitleParams(q="test")),
+        (search_episodes_by_person, SearchByPersonParams(q="test")),
+        (get_episodes, GetEpisodesParams(id=123)),
+        (get_podcast_details, GetPodcastDetailsParams(id=123)),
+        (get_episode_details, GetEpisodeDetailsParams(id=123)),
+    ],
+)
+async def test_api_calls_raise_http_errors(call, params, mock_client):
+    """Each API call should propagate HTTP errors to the caller."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
     mock_client.get.side_effect = httpx.HTTPError("Network error")
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPError):
-            await search_podcasts_by_title(api_key, api_secret, params)
+    with pytest.raises(httpx.HTTPError):
+        await call(credentials, params)
 
 
-@pytest.mark.asyncio
-async def test_search_podcasts_by_title_with_empty_results():
-    """search_podcasts_by_title should handle empty search results."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByTitleParams(q="nonexistent")
-
-    expected_response = {
+@pytest.mark.parametrize(
+    ("call", "params", "items_key"),
+    [
+        (search_podcasts, SearchParams(q="nonexistent"), "feeds"),
+        (search_podcasts_by_title, SearchByTitleParams(q="nonexistent"), "feeds"),
+        (search_episodes_by_person, SearchByPersonParams(q="nonexistent"), "items"),
+    ],
+)
+async def test_searches_handle_empty_results(call, params, items_key):
+    """Searches should return empty results unchanged."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    empty_response = {
         "status": "true",
-        "feeds": [],
+        items_key: [],
         "count": 0,
         "query": "nonexistent",
         "description": "No matches found",
     }
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=empty_response)
+    )
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
-
-    mock_client = AsyncMock()
-
-    mock_client.get.return_value = mock_response
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await call(credentials, params, client=client)
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await search_podcasts_by_title(api_key, api_secret, params)
+    assert result["count"] == 0
+    assert result[items_key] == []
 
-        assert result["count"] == 0
-        assert result["feeds"] == []
 
+def test_retry_delay_prefers_numeric_retry_after():
+    """retry_delay should honor a numeric Retry-After header."""
+    assert retry_delay(0, "2", random_fraction=lambda: 0.5) == 2.0
 
-def test_build_search_by_person_url_with_required_params():
-    """Search by person URL should include base URL and query parameter."""
-    params = SearchByPersonParams(q="Adam Curry")
 
-    url = build_search_by_person_url(params)
+def test_retry_delay_caps_retry_after():
+    """retry_delay should never wait longer than RETRY_MAX_DELAY."""
+    assert retry_delay(0, "3600") == RETRY_MAX_DELAY
 
-    assert url.startswith("https://api.podcastindex.org/api/1.0/search/byperson")
-    assert "q=Adam" in url or "q=Adam+Curry" in url or "q=Adam%20Curry" in url
 
+def test_retry_delay_uses_jittered_exponential_backoff():
+    """Without Retry-After, delay should be exponential backoff scaled by jitter."""
+    assert retry_delay(0, random_fraction=lambda: 1.0) == 0.5
+    assert retry_delay(2, random_fraction=lambda: 1.0) == 2.0
+    assert retry_delay(2, random_fraction=lambda: 0.5) == 1.0
+    assert retry_delay(20, random_fraction=lambda: 1.0) == RETRY_MAX_DELAY
 
-def test_build_search_by_person_url_with_max_results():
-    """Search by person URL should include max parameter when specified."""
-    params = SearchByPersonParams(q="test", max=30)
 
-    url = build_search_by_person_url(params)
+@pytest.mark.parametrize(
+    "retry_after", ["Wed, 21 Oct 2015 07:28:00 GMT", "nan", "inf", "-inf"]
+)
+def test_retry_delay_ignores_unusable_retry_after(retry_after):
+    """HTTP-date and non-finite Retry-After values should fall back to backoff."""
+    delay = retry_delay(1, retry_after, random_fraction=lambda: 1.0)
 
-    assert "max=30" in url
+    assert delay == 1.0
 
 
-def test_build_search_by_person_url_with_fulltext():
-    """Search by person URL should include fulltext parameter when enabled."""
-    params = SearchByPersonParams(q="test", fulltext=True)
+async def test_search_podcasts_retries_rate_limited_requests(mock_client):
+    """A 429 response should be retried after the server-provided delay."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    expected_response = {"status": "true", "feeds": [], "count": 0, "query": "test"}
 
-    url = build_search_by_person_url(params)
+    mock_client.get.side_effect = [
+        _api_response(429, headers={"Retry-After": "1"}),
+        _api_response(200, json=expected_response),
+    ]
 
-    assert "fulltext=true" in url.lower()
+    with patch(
+        "podcast_index.client.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        result = await search_podcasts(credentials, SearchParams(q="test"))
 
+    assert result == expected_response
+    assert mock_client.get.call_count == 2
+    mock_sleep.assert_awaited_once_with(1.0)
 
-def test_build_search_by_person_url_omits_false_fulltext():
-    """Search by person URL should not include fulltext when False."""
-    params = SearchByPersonParams(q="test", fulltext=False)
 
-    url = build_search_by_person_url(params)
+async def test_get_episodes_retries_connection_errors(mock_client):
+    """Connection failures before a response should be retried."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    expected_response = {"status": "true", "items": [], "count": 0}
 
-    assert "fulltext" not in url
+    mock_client.get.side_effect = [
+        httpx.RemoteProtocolError("Server disconnected without sending a response"),
+        _api_response(200, json=expected_response),
+    ]
 
+    with patch("podcast_index.client.asyncio.sleep", new_callable=AsyncMock):
+        result = await get_episodes(credentials, GetEpisodesParams(id=1))
 
-def test_build_search_by_person_url_with_all_params():
-    """Search by person URL should include all parameters when provided."""
-    params = SearchByPersonParams(q="Adam Curry", max=50, fulltext=True)
+    assert result == expected_response
+    assert mock_client.get.call_count == 2
 
-    url = build_search_by_person_url(params)
 
-    assert "q=Adam" in url
-    assert "max=50" in url
-    assert "fulltext=true" in url.lower()
+@pytest.mark.parametrize(
+    ("timeout_error", "expected_calls"),
+    [
+        (httpx.ConnectTimeout("Timed out connecting"), 2),
+        (httpx.ReadTimeout("Timed out reading"), 1),
+        (httpx.WriteTimeout("Timed out writing"), 1),
+        (httpx.PoolTimeout("Timed out waiting for a connection"), 1),
+    ],
+)
+async def test_only_connect_timeouts_are_retried(
+    timeout_error, expected_calls, mock_client
+):
+    """A timeout should be retried only when the connection was never established."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
+    mock_client.get.side_effect = [
+        timeout_error,
+        _api_response(200, json={"status": "true"}),
+    ]
 
-@pytest.mark.asyncio
-async def test_search_episodes_by_person_makes_request_with_auth_headers():
-    """search_episodes_by_person should make HTTP request with authentication headers."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByPersonParams(q="Adam Curry")
+    with patch("podcast_index.client.asyncio.sleep", new_callable=AsyncMock):
+        if expected_calls == 1:
+            with pytest.raises(type(timeout_error)):
+                await get_episodes(credentials, GetEpisodesParams(id=1))
+        else:
+            await get_episodes(credentials, GetEpisodesParams(id=1))
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "true",
-        "items": [],
-        "count": 0,
-        "query": "Adam Curry",
-        "description": "Found matches for 'Adam Curry'",
-    }
+    assert mock_client.get.call_count == expected_calls
 
-    mock_client = AsyncMock()
 
-    mock_client.get.return_value = mock_response
+async def test_get_podcast_details_gives_up_after_max_retries(mock_client):
+    """Persistent server errors should raise after MAX_RETRIES retries."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        await search_episodes_by_person(api_key, api_secret, params)
+    mock_client.get.return_value = _api_response(503)
 
-        mock_client.get.assert_called_once()
-        call_args = mock_client.get.call_args
+    with patch(
+        "podcast_index.client.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_podcast_details(credentials, GetPodcastDetailsParams(id=1))
 
-        headers = call_args.kwargs["headers"]
-        assert headers["X-Auth-Key"] == api_key
-        assert "X-Auth-Date" in headers
-        assert "Authorization" in headers
-        assert "User-Agent" in headers
+    assert mock_client.get.call_count == MAX_RETRIES + 1
+    assert mock_sleep.await_count == MAX_RETRIES
 
 
-@pytest.mark.asyncio
-async def test_search_episodes_by_person_returns_successful_response():
-    """search_episodes_by_person should return parsed response data."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByPersonParams(q="Adam Curry")
+async def test_get_episode_details_does_not_retry_client_errors(mock_client):
+    """Non-retryable statuses such as 404 should fail immediately."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-    expected_response = {
-        "status": "true",
-        "items": [
-            {
-                "id": 789,
-                "title": "Episode about Adam Curry",
-                "feedTitle": "No Agenda",
-                "description": "Discussing Adam Curry",
-            }
-        ],
-        "count": 1,
-        "query": "Adam Curry",
-        "description": "Found 1 match",
-    }
+    mock_client.get.return_value = _api_response(404)
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
-
-    mock_client = AsyncMock()
-
-    mock_client.get.return_value = mock_response
-
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await search_episodes_by_person(api_key, api_secret, params)
+    with patch(
+        "podcast_index.client.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_episode_details(credentials, GetEpisodeDetailsParams(id=1))
 
-        assert result == expected_response
-        assert result["count"] == 1
-        assert len(result["items"]) == 1
+    assert mock_client.get.call_count == 1
+    mock_sleep.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_search_episodes_by_person_handles_http_errors():
-    """search_episodes_by_person should raise exception for HTTP errors."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByPersonParams(q="test")
+async def test_configure_concurrency_limits_requests_in_flight(mock_client):
+    """Concurrent calls should never exceed the configured number of in-flight requests."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    in_flight = 0
+    max_in_flight = 0
 
-    mock_client = AsyncMock()
+    async def slow_get(url, headers):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _api_response(200, json={"status": "true"})
 
-    mock_client.get.side_effect = httpx.HTTPError("Network error")
+    mock_client.get.side_effect = slow_get
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPError):
-            await search_episodes_by_person(api_key, api_secret, params)
+    configure_concurrency(2)
+    try:
+        await asyncio.gather(
+            *(
+                get_podcast_details(credentials, GetPodcastDetailsParams(id=i))
+                for i in range(10)
+            )
+        )
+    finally:
+        configure_concurrency(MAX_CONCURRENT_REQUESTS)
 
+    assert mock_client.get.call_count == 10
+    assert max_in_flight == 2
 
-@pytest.mark.asyncio
-async def test_search_episodes_by_person_with_empty_results():
-    """search_episodes_by_person should handle empty search results."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = SearchByPersonParams(q="nonexistent")
 
-    expected_response = {
-        "status": "true",
-        "items": [],
-        "count": 0,
-        "query": "nonexistent",
-        "description": "No matches found",
-    }
+def test_configure_concurrency_rejects_non_positive_limits():
+    """configure_concurrency should reject limits below 1."""
+    with pytest.raises(ValueError, match="at least 1"):
+        configure_concurrency(0)
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
 
-    mock_client = AsyncMock()
+def test_request_semaphore_is_recreated_for_each_event_loop():
+    """Sequential event loops should each get a semaphore bound to their own loop."""
 
-    mock_client.get.return_value = mock_response
+    async def hold_request_slot() -> asyncio.Semaphore:
+        semaphore = get_request_semaphore()
+        async with semaphore:
+            return semaphore
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await search_episodes_by_person(api_key, api_secret, params)
+    semaphores = []
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        try:
+            semaphores.append(loop.run_until_complete(hold_request_slot()))
+        finally:
+            loop.close()
+    first, second = semaphores
 
-        assert result["count"] == 0
-        assert result["items"] == []
+    assert first is not second
 
 
-def test_build_episodes_url_with_required_params():
-    """Episodes by feed ID URL should include base URL and ID parameter."""
-    params = GetEpisodesParams(id=123456)
+def test_request_semaphore_does_not_keep_closed_event_loops_alive():
+    """The semaphore bookkeeping should not stop a closed loop from being collected."""
 
-    url = build_episodes_url(params)
+    async def hold_request_slot() -> None:
+        async with get_request_semaphore():
+            pass
 
-    assert url.startswith("https://api.podcastindex.org/api/1.0/episodes/byfeedid")
-    assert "id=123456" in url
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(hold_request_slot())
+    finally:
+        loop.close()
+    loop_ref = weakref.ref(loop)
+    del loop
+    gc.collect()
 
+    assert loop_ref() is None
 
-def test_build_episodes_url_with_all_params():
-    """Episodes by feed ID URL should include all parameters when provided."""
-    params = GetEpisodesParams(id=123, since=1609459200, max=50, fulltext=True)
 
-    url = build_episodes_url(params)
+async def test_request_semaphore_is_recreated_after_fork():
+    """A child process should not share the semaphore created by its parent."""
+    parent_semaphore = get_request_semaphore()
 
-    assert "id=123" in url
-    assert "since=1609459200" in url
-    assert "max=50" in url
-    assert "fulltext=true" in url.lower()
+    with patch("podcast_index.client.os.getpid", return_value=-1):
+        child_semaphore = get_request_semaphore()
 
+        assert child_semaphore is not parent_semaphore
+        assert get_request_semaphore() is child_semaphore
 
-@pytest.mark.asyncio
-async def test_get_episodes_returns_successful_response():
-    """get_episodes should return parsed response data."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = GetEpisodesParams(id=123456)
 
-    expected_response = {
-        "status": "true",
-        "items": [
-            {
-                "id": 789,
-                "title": "Episode 1",
-                "description": "First episode",
-                "datePublished": 1609459200,
-            }
-        ],
-        "count": 1,
-    }
+async def test_get_podcast_details_many_returns_results_in_order(mock_client):
+    """Batch lookups should return one response per ID, in the order requested."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
+    async def get_by_id(url, headers):
+        feed_id = int(url.rsplit("=", 1)[1])
+        return _api_response(200, json={"status": "true", "feed": {"id": feed_id}})
 
-    mock_client = AsyncMock()
+    mock_client.get.side_effect = get_by_id
 
-    mock_client.get.return_value = mock_response
+    results = await get_podcast_details_many(credentials, [3, 1, 2])
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await get_episodes(api_key, api_secret, params)
+    assert [
+        result["feed"]["id"] if isinstance(result, dict) else result
+        for result in results
+    ] == [3, 1, 2]
 
-        assert result == expected_response
-        assert result["count"] == 1
 
+async def test_get_episode_details_many_returns_failures_in_place(mock_client):
+    """A failed lookup should not cancel the rest of the batch."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-@pytest.mark.asyncio
-async def test_get_episodes_handles_http_errors():
-    """get_episodes should raise exception for HTTP errors."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = GetEpisodesParams(id=123)
+    mock_client.get.side_effect = [
+        _api_response(200, json={"status": "true", "episode": {"id": 1}}),
+        _api_response(404),
+    ]
 
-    mock_client = AsyncMock()
+    results = await get_episode_details_many(credentials, [1, 2], fulltext=True)
 
-    mock_client.get.side_effect = httpx.HTTPError("Network error")
+    found, missing = results
+    assert isinstance(found, dict)
+    assert found["episode"]["id"] == 1
+    assert isinstance(missing, httpx.HTTPStatusError)
+    assert all(
+        "fulltext=true" in call.args[0] for call in mock_client.get.call_args_list
+    )
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPError):
-            await get_episodes(api_key, api_secret, params)
 
+async def test_search_podcasts_many_sends_one_request_per_search():
+    """Batch searches should send each query over the one client, in order."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    queries = ["python", "history", "true crime"]
 
-def test_build_podcast_details_url_with_required_params():
-    """Podcast details URL should include base URL and ID parameter."""
-    params = GetPodcastDetailsParams(id=920666)
+    def echo_query(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"query": request.url.params["q"]})
 
-    url = build_podcast_details_url(params)
+    transport = httpx.MockTransport(echo_query)
+    async with httpx.AsyncClient(transport=transport) as client:
+        results = await search_podcasts_many(
+            credentials, [SearchParams(q=query) for query in queries], client=client
+        )
 
-    assert url.startswith("https://api.podcastindex.org/api/1.0/podcasts/byfeedid")
-    assert "id=920666" in url
+    assert [
+        result["query"] if isinstance(result, dict) else result for result in results
+    ] == queries
 
 
-@pytest.mark.asyncio
-async def test_get_podcast_details_returns_successful_response():
-    """get_podcast_details should return parsed response data."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = GetPodcastDetailsParams(id=920666)
+async def test_repeated_lookup_is_served_from_cache(mock_client):
+    """A second identical request within the TTL should not hit the network."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    expected_response = {"status": "true", "feed": {"id": 1}}
 
-    expected_response = {
-        "status": "true",
-        "feed": {
-            "id": 920666,
-            "title": "No Agenda",
-            "description": "The best podcast in the universe",
-            "url": "https://example.com/feed",
-        },
-    }
+    mock_client.get.return_value = _api_response(200, json=expected_response)
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
+    first = await get_podcast_details(credentials, GetPodcastDetailsParams(id=1))
+    second = await get_podcast_details(credentials, GetPodcastDetailsParams(id=1))
 
-    mock_client = AsyncMock()
+    assert first == second == expected_response
+    assert mock_client.get.call_count == 1
 
-    mock_client.get.return_value = mock_response
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await get_podcast_details(api_key, api_secret, params)
+async def test_search_podcasts_cache_hit_skips_http(mock_client):
+    """Repeating a search within its TTL should reuse the cached results."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    mock_client.get.return_value = _api_response(200, json={"status": "true"})
 
-        assert result == expected_response
-        assert result["feed"]["id"] == 920666
+    with patch("podcast_index.client.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 0.0
+        await search_podcasts(credentials, SearchParams(q="test"))
 
+        mock_monotonic.return_value = 600.0
+        await search_podcasts(credentials, SearchParams(q="test"))
+        await search_podcasts(credentials, SearchParams(q="test", max=5))
 
-@pytest.mark.asyncio
-async def test_get_podcast_details_handles_http_errors():
-    """get_podcast_details should raise exception for HTTP errors."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = GetPodcastDetailsParams(id=123)
+    assert mock_client.get.call_count == 2
 
-    mock_client = AsyncMock()
 
-    mock_client.get.side_effect = httpx.HTTPError("Network error")
+async def test_response_cache_is_not_shared_between_credentials(mock_client):
+    """A response cached for one API key should never be served to another."""
+    mock_client.get.side_effect = [
+        _api_response(200, json={"status": "true"}),
+        _api_response(401),
+    ]
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPError):
-            await get_podcast_details(api_key, api_secret, params)
+    await search_podcasts(
+        Credentials(api_key="valid_key", api_secret="secret"), SearchParams(q="test")
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await search_podcasts(
+            Credentials(api_key="invalid_key", api_secret="secret"),
+            SearchParams(q="test"),
+        )
 
+    assert mock_client.get.call_count == 2
 
-def test_build_episode_details_url_with_required_params():
-    """Episode details URL should include base URL and ID parameter."""
-    params = GetEpisodeDetailsParams(id=16795090)
 
-    url = build_episode_details_url(params)
+async def test_injected_client_bypasses_response_cache(mock_client):
+    """Requests through an injected client should neither read nor fill the shared cache."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
+    mock_client.get.return_value = _api_response(200, json={"source": "shared"})
+    injected_client = AsyncMock()
+    injected_client.get.return_value = _api_response(200, json={"source": "injected"})
 
-    assert url.startswith("https://api.podcastindex.org/api/1.0/episodes/byid")
-    assert "id=16795090" in url
+    shared = await search_podcasts(credentials, SearchParams(q="test"))
+    injected = await search_podcasts(
+        credentials, SearchParams(q="test"), client=injected_client
+    )
+    await search_podcasts(credentials, SearchParams(q="test"), client=injected_client)
 
+    assert shared == {"source": "shared"}
+    assert injected == {"source": "injected"}
+    assert injected_client.get.call_count == 2
+    assert mock_client.get.call_count == 1
 
-def test_build_episode_details_url_with_fulltext():
-    """Episode details URL should include fulltext parameter when enabled."""
-    params = GetEpisodeDetailsParams(id=123, fulltext=True)
 
-    url = build_episode_details_url(params)
+async def test_episode_listings_expire_before_details(mock_client):
+    """Episode listings should be refetched once their shorter TTL has passed."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-    assert "id=123" in url
-    assert "fulltext=true" in url.lower()
+    mock_client.get.return_value = _api_response(200, json={"status": "true"})
 
+    with patch("podcast_index.client.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 0.0
+        await get_episodes(credentials, GetEpisodesParams(id=1))
+        await get_podcast_details(credentials, GetPodcastDetailsParams(id=1))
 
-@pytest.mark.asyncio
-async def test_get_episode_details_returns_successful_response():
-    """get_episode_details should return parsed response data."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = GetEpisodeDetailsParams(id=16795090)
+        mock_monotonic.return_value = 600.0
+        await get_episodes(credentials, GetEpisodesParams(id=1))
+        await get_podcast_details(credentials, GetPodcastDetailsParams(id=1))
 
-    expected_response = {
-        "status": "true",
-        "episode": {
-            "id": 16795090,
-            "title": "Special Episode",
-            "description": "An amazing episode",
-            "feedId": 920666,
-        },
-    }
+    assert mock_client.get.call_count == 3
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = expected_response
 
-    mock_client = AsyncMock()
+async def test_failed_requests_are_not_cached(mock_client):
+    """Errors should propagate without poisoning the cache for later calls."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-    mock_client.get.return_value = mock_response
+    mock_client.get.side_effect = [
+        _api_response(404),
+        _api_response(200, json={"status": "true"}),
+    ]
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        result = await get_episode_details(api_key, api_secret, params)
+    with pytest.raises(httpx.HTTPStatusError):
+        await get_episode_details(credentials, GetEpisodeDetailsParams(id=1))
+    result = await get_episode_details(credentials, GetEpisodeDetailsParams(id=1))
 
-        assert result == expected_response
-        assert result["episode"]["id"] == 16795090
+    assert result == {"status": "true"}
 
 
-@pytest.mark.asyncio
-async def test_get_episode_details_handles_http_errors():
-    """get_episode_details should raise exception for HTTP errors."""
-    api_key = "test_key"
-    api_secret = "test_secret"
-    params = GetEpisodeDetailsParams(id=123)
+async def test_response_cache_evicts_oldest_entry_when_full(mock_client):
+    """The cache should stay bounded by evicting the oldest entry."""
+    credentials = Credentials(api_key="test_key", api_secret="test_secret")
 
-    mock_client = AsyncMock()
+    mock_client.get.return_value = _api_response(200, json={"status": "true"})
 
-    mock_client.get.side_effect = httpx.HTTPError("Network error")
+    for feed_id in range(RESPONSE_CACHE_MAXSIZE + 1):
+        await get_podcast_details(credentials, GetPodcastDetailsParams(id=feed_id))
+    await get_podcast_details(credentials, GetPodcastDetailsParams(id=0))
 
-    with patch("podcast_index.client.get_client", return_value=mock_client):
-        with pytest.raises(httpx.HTTPError):
-            await get_episode_details(api_key, api_secret, params)
+    assert len(podcast_index.client._response_cache) == RESPONSE_CACHE_MAXSIZE
+    assert mock_client.get.call_count == RESPONSE_CACHE_MAXSIZE + 2
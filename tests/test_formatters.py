@@ -0,0 +1,475 @@
+import copy
+
+import pytest
+
+from podcast_index.formatters import (
+    format_episode_details,
+    format_episode_results,
+    format_podcast_details,
+    format_search_results,
+)
+
+# Longer than any truncation limit the formatters have ever applied
+LONG_DESCRIPTION = "a" * 300
+
+# API responses with every field the formatters render populated
+FULL_SEARCH_RESPONSE = {
+    "count": 1,
+    "query": "test",
+    "feeds": [
+        {
+            "id": 123,
+            "title": "Test Podcast",
+            "url": "https://example.com/feed.xml",
+            "originalUrl": "https://original.example.com/feed.xml",
+            "link": "https://example.com",
+            "description": "Podcast description",
+            "author": "Test Author",
+            "ownerName": "Test Owner",
+            "image": "https://example.com/image.jpg",
+            "artwork": "https://example.com/artwork.jpg",
+            "lastUpdateTime": 1609459200,
+            "lastCrawlTime": 1609459100,
+            "lastParseTime": 1609459000,
+            "lastGoodHttpStatusTime": 1609458900,
+            "lastHttpStatus": 200,
+            "contentType": "application/rss+xml",
+            "itunesId": 123456789,
+            "generator": "Podcast Generator 1.0",
+            "language": "en",
+            "type": 0,
+            "dead": 0,
+            "crawlErrors": 0,
+            "parseErrors": 0,
+        }
+    ],
+}
+
+FULL_EPISODE_SEARCH_RESPONSE = {
+    "count": 1,
+    "query": "test",
+    "items": [
+        {
+            "id": 123,
+            "title": "Test Episode",
+            "feedTitle": "Test Podcast",
+            "description": "Episode description",
+            "feedId": 456,
+            "datePublished": 1609459200,
+            "datePublishedPretty": "January 01, 2021 12:00am",
+            "duration": 3600,
+            "enclosureUrl": "https://example.com/episode.mp3",
+            "enclosureType": "audio/mpeg",
+            "enclosureLength": 52428800,
+            "link": "https://example.com/episode",
+            "image": "https://example.com/episode.jpg",
+            "feedImage": "https://example.com/feed.jpg",
+            "feedUrl": "https://example.com/feed.xml",
+            "feedAuthor": "Test Author",
+            "chaptersUrl": "https://example.com/chapters.json",
+            "transcriptUrl": "https://example.com/transcript.json",
+        }
+    ],
+}
+
+FULL_PODCAST_DETAILS_RESPONSE = {
+    "status": "true",
+    "feed": {
+        "id": 123,
+        "title": "Test Podcast",
+        "url": "https://example.com/feed.xml",
+        "originalUrl": "https://original.example.com/feed.xml",
+        "link": "https://example.com",
+        "description": "Detailed podcast description",
+        "author": "Test Author",
+        "ownerName": "Test Owner",
+        "image": "https://example.com/image.jpg",
+        "artwork": "https://example.com/artwork.jpg",
+        "lastUpdateTime": 1609459200,
+        "lastCrawlTime": 1609459100,
+        "lastParseTime": 1609459000,
+        "lastGoodHttpStatusTime": 1609458900,
+        "lastHttpStatus": 200,
+        "contentType": "application/rss+xml",
+        "itunesId": 123456789,
+        "generator": "Podcast Generator 1.0",
+        "language": "en",
+        "type": 0,
+        "dead": 0,
+        "crawlErrors": 0,
+        "parseErrors": 0,
+        "categories": {"1": "Technology", "2": "News"},
+        "locked": 0,
+        "explicit": False,
+        "episodeCount": 100,
+        "imageUrlHash": 123456,
+    },
+}
+
+FULL_EPISODE_DETAILS_RESPONSE = {
+    "status": "true",
+    "episode": {
+        "id": 123,
+        "title": "Test Episode",
+        "feedTitle": "Test Podcast",
+        "description": "Detailed episode description",
+        "feedId": 456,
+        "datePublished": 1609459200,
+        "datePublishedPretty": "January 01, 2021 12:00am",
+        "duration": 3600,
+        "enclosureUrl": "https://example.com/episode.mp3",
+        "enclosureType": "audio/mpeg",
+        "enclosureLength": 52428800,
+        "link": "https://example.com/episode",
+        "image": "https://example.com/episode.jpg",
+        "feedImage": "https://example.com/feed.jpg",
+        "feedUrl": "https://example.com/feed.xml",
+        "feedAuthor": "Test Author",
+        "chaptersUrl": "https://example.com/chapters.json",
+        "transcriptUrl": "https://example.com/transcript.json",
+        "season": 1,
+        "episode": 5,
+        "episodeType": "full",
+        "explicit": 0,
+        "feedItunesId": 123456789,
+        "feedLanguage": "en",
+        "persons": [
+            {"name": "John Doe", "role": "host"},
+            {"name": "Jane Smith", "role": "guest"},
+        ],
+        "socialInteract": [
+            {
+                "protocol": "activitypub",
+                "uri": "https://mastodon.example/@user",
+                "accountId": "@user@mastodon.example",
+            }
+        ],
+    },
+}
+
+
+def test_format_search_results_with_results():
+    """format_search_results should format podcasts into readable text."""
+    response = {
+        "count": 2,
+        "query": "python",
+        "feeds": [
+            {
+                "id": 1,
+                "title": "Python Weekly",
+                "url": "https://example.com/feed",
+                "description": "A weekly Python podcast",
+                "author": "Test Author",
+            },
+            {
+                "id": 2,
+                "title": "Talk Python",
+                "url": "https://example.com/feed2",
+                "description": "Another Python podcast",
+            },
+        ],
+    }
+
+    result = format_search_results(response)
+
+    assert "2 podcast(s)" in result
+    assert "Python Weekly" in result
+    assert "Talk Python" in result
+    assert "Test Author" in result
+
+
+def test_format_search_results_with_empty_results():
+    """format_search_results should handle empty results."""
+    response = {"count": 0, "query": "nonexistent", "feeds": []}
+
+    result = format_search_results(response)
+
+    assert "No matches" in result
+    assert "nonexistent" in result
+
+
+def test_format_search_results_does_not_truncate_descriptions():
+    """format_search_results should not truncate descriptions - API handles that."""
+    response = {
+        "count": 1,
+        "query": "test",
+        "feeds": [
+            {
+                "id": 1,
+                "title": "Test",
+                "description": LONG_DESCRIPTION,
+                "url": "https://test",
+            }
+        ],
+    }
+
+    result = format_search_results(response)
+
+    assert LONG_DESCRIPTION in result
+
+
+def test_format_search_results_with_minimal_feed_data():
+    """format_search_results should handle feeds with only required fields."""
+    response = {
+        "count": 1,
+        "query": "minimal",
+        "feeds": [
+            {"id": 123, "title": "Minimal Podcast"}
+            # Missing: author, description, url
+        ],
+    }
+
+    result = format_search_results(response)
+
+    assert "Minimal Podcast" in result
+    assert "1 podcast(s)" in result
+    assert "minimal" in result
+    assert "Podcast Index ID: 123" in result
+
+
+def test_format_episode_results_with_results():
+    """format_episode_results should format episodes into readable text."""
+    response = {
+        "count": 2,
+        "query": "Adam Curry",
+        "items": [
+            {
+                "id": 123,
+                "title": "Episode 1",
+                "feedTitle": "No Agenda",
+                "description": "An episode about podcasting",
+                "feedId": 456,
+            },
+            {
+                "id": 789,
+                "title": "Episode 2",
+                "feedTitle": "The Bitcoin Podcast",
+                "description": "Discussion about Bitcoin",
+            },
+        ],
+    }
+
+    result = format_episode_results(response)
+
+    assert "2 episode(s)" in result
+    assert "Episode 1" in result
+    assert "Episode 2" in result
+    assert "No Agenda" in result
+    assert "The Bitcoin Podcast" in result
+
+
+def test_format_episode_results_with_empty_results():
+    """format_episode_results should handle empty results."""
+    response = {"count": 0, "query": "nonexistent", "items": []}
+
+    result = format_episode_results(response)
+
+    assert "No matches" in result
+    assert "nonexistent" in result
+
+
+def test_format_episode_results_does_not_truncate_descriptions():
+    """format_episode_results should not truncate descriptions - API handles that."""
+    response = {
+        "count": 1,
+        "query": "test",
+        "items": [
+            {
+                "id": 1,
+                "title": "Test Episode",
+                "feedTitle": "Test Podcast",
+                "description": LONG_DESCRIPTION,
+            }
+        ],
+    }
+
+    result = format_episode_results(response)
+
+    assert LONG_DESCRIPTION in result
+
+
+def test_format_episode_results_with_minimal_episode_data():
+    """format_episode_results should handle episodes with only required fields."""
+    response = {
+        "count": 1,
+        "query": "minimal",
+        "items": [{"id": 123, "title": "Minimal Episode"}],
+    }
+
+    result = format_episode_results(response)
+
+    assert "Minimal Episode" in result
+    assert "1 episode(s)" in result
+    assert "Episode ID: 123" in result
+
+
+def test_format_podcast_details_with_complete_data():
+    """format_podcast_details should format podcast details into readable text."""
+    response = {
+        "status": "true",
+        "feed": {
+            "id": 920666,
+            "title": "No Agenda",
+            "description": "The best podcast in the universe",
+            "author": "Adam Curry and John C. Dvorak",
+            "url": "https://example.com/feed",
+            "link": "https://noagendashow.net",
+            "image": "https://example.com/image.jpg",
+        },
+    }
+
+    result = format_podcast_details(response)
+
+    assert "No Agenda" in result
+    assert "Adam Curry" in result
+    assert "The best podcast in the universe" in result
+
+
+def test_format_podcast_details_with_minimal_data():
+    """format_podcast_details should handle minimal podcast data."""
+    response = {"status": "true", "feed": {"id": 123, "title": "Test Podcast"}}
+
+    result = format_podcast_details(response)
+
+    assert "Test Podcast" in result
+    assert "Podcast Index ID: 123" in result
+
+
+def test_format_episode_details_with_complete_data():
+    """format_episode_details should format episode details into readable text."""
+    response = {
+        "status": "true",
+        "episode": {
+            "id": 16795090,
+            "title": "Special Episode",
+            "description": "An amazing episode about podcasting",
+            "feedTitle": "No Agenda",
+            "feedId": 920666,
+            "link": "https://example.com/episode",
+        },
+    }
+
+    result = format_episode_details(response)
+
+    assert "Special Episode" in result
+    assert "No Agenda" in result
+    assert "amazing episode" in result
+
+
+def test_format_episode_details_with_minimal_data():
+    """format_episode_details should handle minimal episode data."""
+    response = {"status": "true", "episode": {"id": 123, "title": "Test Episode"}}
+
+    result = format_episode_details(response)
+
+    assert "Test Episode" in result
+    assert "Episode ID: 123" in result
+
+
+@pytest.mark.parametrize(
+    ("formatter", "response", "expected"),
+    [
+        pytest.param(
+            format_search_results,
+            FULL_SEARCH_RESPONSE,
+            (
+                "Test Podcast",
+                "Test Author",
+                "Test Owner",
+                "Podcast description",
+                "https://example.com/feed.xml",
+                "https://original.example.com/feed.xml",
+                "https://example.com",
+                "https://example.com/image.jpg",
+                "https://example.com/artwork.jpg",
+                "Podcast Index ID: 123",
+                "123456789",
+                "application/rss+xml",
+                "en",
+            ),
+            id="search-results",
+        ),
+        pytest.param(
+            format_episode_results,
+            FULL_EPISODE_SEARCH_RESPONSE,
+            (
+                "Test Episode",
+                "Test Podcast",
+                "Episode description",
+                "Episode ID: 123",
+                "Podcast ID: 456",
+                "Published: 1609459200",
+                "Duration: 1:00:00",
+                "https://example.com/episode.mp3",
+                "audio/mpeg",
+                "File Size: 52428800 bytes",
+                "https://example.com/episode",
+                "https://example.com/episode.jpg",
+                "https://example.com/feed.jpg",
+                "https://example.com/feed.xml",
+                "Test Author",
+                "https://example.com/chapters.json",
+                "https://example.com/transcript.json",
+            ),
+            id="episode-results",
+        ),
+        pytest.param(
+            format_podcast_details,
+            FULL_PODCAST_DETAILS_RESPONSE,
+            (
+                "Test Podcast",
+                "Test Author",
+                "Test Owner",
+                "Detailed podcast description",
+                "https://example.com/feed.xml",
+                "https://original.example.com/feed.xml",
+                "https://example.com",
+                "https://example.com/image.jpg",
+                "https://example.com/artwork.jpg",
+                "Podcast Index ID: 123",
+                "123456789",
+                "application/rss+xml",
+                "en",
+                "Episode Count: 100",
+            ),
+            id="podcast-details",
+        ),
+        pytest.param(
+            format_episode_details,
+            FULL_EPISODE_DETAILS_RESPONSE,
+            (
+                "Test Episode",
+                "Test Podcast",
+                "Detailed episode description",
+                "Episode ID: 123",
+                "Podcast ID: 456",
+                "Published: 1609459200",
+                "Duration: 1:00:00",
+                "https://example.com/episode.mp3",
+                "audio/mpeg",
+                "File Size: 52428800 bytes",
+                "https://example.com/episode",
+                "https://example.com/episode.jpg",
+                "https://example.com/feed.jpg",
+                "https://example.com/feed.xml",
+                "Test Author",
+                "https://example.com/chapters.json",
+                "https://example.com/transcript.json",
+                "Season: 1",
+                "Episode: 5",
+                "John Doe",
+                "Jane Smith",
+            ),
+            id="episode-details",
+        ),
+    ],
+)
+def test_formatters_include_all_api_fields(formatter, response, expected):
+    """Formatters should render every field present in a fully populated API response."""
+    original = copy.deepcopy(response)
+
+    result = formatter(response)
+
+    missing = [text for text in expected if text not in result]
+    assert not missing, missing
+    assert response == original, "formatter mutated the shared response"